@@ -279,6 +279,17 @@ impl Engine {
         self.jump_to_ip(target_ip)
     }
 
+    /// Restarts the loaded script from its initial state.
+    ///
+    /// Equivalent to building a new engine from the same script, without
+    /// re-validating or re-compiling it. Session history is cleared too.
+    pub fn reset(&mut self) {
+        self.state = initialize_state(&self.script);
+        self.queued_audio = initial_audio_commands(&self.state);
+        self.read_dialogue_ips.clear();
+        self.choice_history.clear();
+    }
+
     /// Restores the engine state from a saved snapshot.
     pub fn set_state(&mut self, state: EngineState) -> VnResult<()> {
         if state.position as usize > self.script.events.len() {
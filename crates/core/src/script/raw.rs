@@ -2,6 +2,7 @@ use std::collections::{BTreeMap, HashMap};
 use std::sync::Arc;
 
 use schemars::JsonSchema;
+use serde::Deserialize;
 
 use crate::error::{VnError, VnResult};
 use crate::event::{
@@ -63,19 +64,39 @@ impl ScriptRaw {
                 "script json input budget".to_string(),
             ));
         }
-        let mut payload: serde_json::Value =
+        let payload: serde_json::Value =
             serde_json::from_str(input).map_err(|err| json_deserialize_error(input, &err))?;
+        Self::from_payload(payload, limits)
+    }
+
+    /// Builds a raw script from an already parsed JSON value with resource limits.
+    ///
+    /// Applies the same input budget, migration, schema check and string budget
+    /// as [`ScriptRaw::from_json_with_limits`], without a round trip through JSON
+    /// text. `encoded_len` is the length of the value's compact JSON encoding,
+    /// which callers track while building the value; the input budget applies to it.
+    pub fn from_json_value_with_limits(
+        payload: serde_json::Value,
+        encoded_len: usize,
+        limits: ResourceLimiter,
+    ) -> VnResult<Self> {
+        if encoded_len > limits.max_script_bytes {
+            return Err(VnError::ResourceLimit(
+                "script json input budget".to_string(),
+            ));
+        }
+        Self::from_payload(payload, limits)
+    }
+
+    fn from_payload(mut payload: serde_json::Value, limits: ResourceLimiter) -> VnResult<Self> {
         migrate_script_json_value(&mut payload)
             .map_err(|err| VnError::InvalidScript(format!("script migration failed: {err}")))?;
 
-        let migrated_input =
-            serde_json::to_string_pretty(&payload).map_err(|err| VnError::Serialization {
-                message: err.to_string(),
-                src: input.to_string(),
-                span: (0, 0).into(),
-            })?;
-        let envelope: ScriptEnvelope = serde_json::from_value(payload)
-            .map_err(|err| json_deserialize_error(&migrated_input, &err))?;
+        let envelope = ScriptEnvelope::deserialize(&payload).map_err(|err| {
+            // The migrated text is only needed to point at the error.
+            let migrated_input = serde_json::to_string_pretty(&payload).unwrap_or_default();
+            json_deserialize_error(&migrated_input, &err)
+        })?;
         match envelope.script_schema_version.as_deref() {
             Some(version) if is_compatible_schema(version) => {
                 let script = Self {
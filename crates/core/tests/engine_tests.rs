@@ -117,6 +117,30 @@ fn engine_marks_dialogue_as_read_by_ip() {
     assert!(engine.is_dialogue_read(1));
 }
 
+#[test]
+fn engine_reset_matches_a_fresh_engine() {
+    let mut engine = Engine::new(
+        sample_script(),
+        SecurityPolicy::default(),
+        ResourceLimiter::default(),
+    )
+    .unwrap();
+    let mut fresh = engine.clone();
+    let _ = engine.step().unwrap();
+    let _ = engine.step().unwrap();
+    let _ = engine.choose(0).unwrap();
+
+    engine.reset();
+    assert_eq!(engine.state().position, fresh.state().position);
+    assert_eq!(
+        engine.visual_state().background,
+        fresh.visual_state().background
+    );
+    assert!(engine.choice_history().is_empty());
+    assert!(!engine.is_dialogue_read(1));
+    assert_eq!(engine.take_audio_commands(), fresh.take_audio_commands());
+}
+
 #[test]
 fn engine_state_round_trip() {
     let script = sample_script();
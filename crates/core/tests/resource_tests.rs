@@ -47,3 +47,28 @@ fn test_oversized_invalid_json_rejects_before_deserialize() {
     let result = ScriptRaw::from_json_with_limits(&oversized_invalid_json, limits);
     assert!(matches!(result, Err(VnError::ResourceLimit(_))));
 }
+
+#[test]
+fn test_json_value_scripts_share_the_text_limits() {
+    let script_json = format!(
+        r#"{{"script_schema_version":"{SCRIPT_SCHEMA_VERSION}","events":[{{"type":"dialogue","speaker":"A","text":"{text}"}}],"labels":{{"start":0}}}}"#,
+        text = "a".repeat(64)
+    );
+    let payload: serde_json::Value = serde_json::from_str(&script_json).expect("valid json");
+
+    let parsed = ScriptRaw::from_json_value_with_limits(
+        payload.clone(),
+        script_json.len(),
+        ResourceLimiter::default(),
+    )
+    .expect("value script");
+    let expected = ScriptRaw::from_json(&script_json).expect("text script");
+    assert_eq!(parsed.to_json().ok(), expected.to_json().ok());
+
+    let limits = ResourceLimiter {
+        max_script_bytes: script_json.len() - 1,
+        ..ResourceLimiter::default()
+    };
+    let result = ScriptRaw::from_json_value_with_limits(payload, script_json.len(), limits);
+    assert!(matches!(result, Err(VnError::ResourceLimit(_))));
+}
@@ -13,19 +13,20 @@ pub struct PyScriptBuilder {
     labels: BTreeMap<String, usize>,
 }
 
+/// Borrowed view of the builder state, serialized without cloning events.
 #[derive(Serialize)]
-struct StableScript {
-    script_schema_version: String,
-    events: Vec<EventRaw>,
-    labels: BTreeMap<String, usize>,
+struct StableScript<'a> {
+    script_schema_version: &'static str,
+    events: &'a [EventRaw],
+    labels: &'a BTreeMap<String, usize>,
 }
 
-impl StableScript {
-    fn from_parts(events: &[EventRaw], labels: &BTreeMap<String, usize>) -> Self {
+impl<'a> StableScript<'a> {
+    fn from_parts(events: &'a [EventRaw], labels: &'a BTreeMap<String, usize>) -> Self {
         Self {
-            script_schema_version: SCRIPT_SCHEMA_VERSION.to_string(),
-            events: events.to_vec(),
-            labels: labels.clone(),
+            script_schema_version: SCRIPT_SCHEMA_VERSION,
+            events,
+            labels,
         }
     }
 }
@@ -1,105 +1,120 @@
+use pyo3::exceptions::{PyTypeError, PyValueError};
+use pyo3::intern;
 use pyo3::prelude::*;
-use pyo3::types::{PyDict, PyDictMethods, PyList, PyListMethods};
+use pyo3::types::{
+    PyBool, PyDict, PyDictMethods, PyFloat, PyInt, PyList, PyListMethods, PyString, PyTuple,
+};
 use visual_novel_engine::{
     CharacterPatchCompiled, CharacterPlacementCompiled, EventCompiled, SharedStr, UiState, UiView,
 };
 
+/// Converts a compiled event into the Python dict shape used by the bindings.
+///
+/// Keys and type tags go through `intern!`, so each call reuses cached Python
+/// strings instead of allocating them per event.
 pub fn event_to_python(event: &EventCompiled, py: Python<'_>) -> PyResult<PyObject> {
     let dict = PyDict::new(py);
     match event {
         EventCompiled::Dialogue(dialogue) => {
-            dict.set_item("type", "dialogue")?;
-            dict.set_item("speaker", dialogue.speaker.as_ref())?;
-            dict.set_item("text", dialogue.text.as_ref())?;
+            dict.set_item(intern!(py, "type"), intern!(py, "dialogue"))?;
+            dict.set_item(intern!(py, "speaker"), dialogue.speaker.as_ref())?;
+            dict.set_item(intern!(py, "text"), dialogue.text.as_ref())?;
         }
         EventCompiled::Choice(choice) => {
-            dict.set_item("type", "choice")?;
-            dict.set_item("prompt", choice.prompt.as_ref())?;
+            dict.set_item(intern!(py, "type"), intern!(py, "choice"))?;
+            dict.set_item(intern!(py, "prompt"), choice.prompt.as_ref())?;
             let options = PyList::empty(py);
             for option in &choice.options {
                 let option_dict = PyDict::new(py);
-                option_dict.set_item("text", option.text.as_ref())?;
-                option_dict.set_item("target", option.target_ip)?;
-                option_dict.set_item("target_ip", option.target_ip)?;
+                option_dict.set_item(intern!(py, "text"), option.text.as_ref())?;
+                option_dict.set_item(intern!(py, "target"), option.target_ip)?;
+                option_dict.set_item(intern!(py, "target_ip"), option.target_ip)?;
                 options.append(option_dict)?;
             }
-            dict.set_item("options", options)?;
+            dict.set_item(intern!(py, "options"), options)?;
         }
         EventCompiled::Scene(scene) => {
-            dict.set_item("type", "scene")?;
-            dict.set_item("background", scene.background.as_deref())?;
-            dict.set_item("music", scene.music.as_deref())?;
+            dict.set_item(intern!(py, "type"), intern!(py, "scene"))?;
+            dict.set_item(intern!(py, "background"), scene.background.as_deref())?;
+            dict.set_item(intern!(py, "music"), scene.music.as_deref())?;
             let characters = PyList::empty(py);
             for character in &scene.characters {
                 let character_dict = PyDict::new(py);
-                character_dict.set_item("name", character.name.as_ref())?;
-                character_dict.set_item("expression", character.expression.as_deref())?;
-                character_dict.set_item("position", character.position.as_deref())?;
-                character_dict.set_item("x", character.x)?;
-                character_dict.set_item("y", character.y)?;
-                character_dict.set_item("scale", character.scale)?;
+                character_dict.set_item(intern!(py, "name"), character.name.as_ref())?;
+                character_dict
+                    .set_item(intern!(py, "expression"), character.expression.as_deref())?;
+                character_dict.set_item(intern!(py, "position"), character.position.as_deref())?;
+                character_dict.set_item(intern!(py, "x"), character.x)?;
+                character_dict.set_item(intern!(py, "y"), character.y)?;
+                character_dict.set_item(intern!(py, "scale"), character.scale)?;
                 characters.append(character_dict)?;
             }
-            dict.set_item("characters", characters)?;
+            dict.set_item(intern!(py, "characters"), characters)?;
         }
         EventCompiled::Jump { target_ip } => {
-            dict.set_item("type", "jump")?;
-            dict.set_item("target", *target_ip)?;
-            dict.set_item("target_ip", *target_ip)?;
+            dict.set_item(intern!(py, "type"), intern!(py, "jump"))?;
+            dict.set_item(intern!(py, "target"), *target_ip)?;
+            dict.set_item(intern!(py, "target_ip"), *target_ip)?;
         }
         EventCompiled::SetFlag { flag_id, value } => {
-            dict.set_item("type", "set_flag")?;
-            dict.set_item("key", *flag_id)?;
-            dict.set_item("flag_id", *flag_id)?;
-            dict.set_item("value", *value)?;
+            dict.set_item(intern!(py, "type"), intern!(py, "set_flag"))?;
+            dict.set_item(intern!(py, "key"), *flag_id)?;
+            dict.set_item(intern!(py, "flag_id"), *flag_id)?;
+            dict.set_item(intern!(py, "value"), *value)?;
         }
         EventCompiled::SetVar { var_id, value } => {
-            dict.set_item("type", "set_var")?;
-            dict.set_item("var_id", *var_id)?;
-            dict.set_item("value", *value)?;
+            dict.set_item(intern!(py, "type"), intern!(py, "set_var"))?;
+            dict.set_item(intern!(py, "var_id"), *var_id)?;
+            dict.set_item(intern!(py, "value"), *value)?;
         }
         EventCompiled::JumpIf { target_ip, .. } => {
-            dict.set_item("type", "jump_if")?;
-            dict.set_item("target_ip", *target_ip)?;
+            dict.set_item(intern!(py, "type"), intern!(py, "jump_if"))?;
+            dict.set_item(intern!(py, "target_ip"), *target_ip)?;
         }
         EventCompiled::Patch(patch) => {
-            dict.set_item("type", "patch")?;
-            dict.set_item("background", patch.background.as_deref())?;
-            dict.set_item("music", patch.music.as_deref())?;
-            dict.set_item("add", characters_to_python(py, &patch.add)?)?;
-            dict.set_item("update", patch_update_to_python(py, &patch.update)?)?;
-            dict.set_item("remove", string_list_to_python(py, &patch.remove)?)?;
+            dict.set_item(intern!(py, "type"), intern!(py, "patch"))?;
+            dict.set_item(intern!(py, "background"), patch.background.as_deref())?;
+            dict.set_item(intern!(py, "music"), patch.music.as_deref())?;
+            dict.set_item(intern!(py, "add"), characters_to_python(py, &patch.add)?)?;
+            dict.set_item(
+                intern!(py, "update"),
+                patch_update_to_python(py, &patch.update)?,
+            )?;
+            dict.set_item(
+                intern!(py, "remove"),
+                string_list_to_python(py, &patch.remove)?,
+            )?;
         }
         EventCompiled::ExtCall { command, args } => {
-            dict.set_item("type", "ext_call")?;
-            dict.set_item("command", command)?;
+            dict.set_item(intern!(py, "type"), intern!(py, "ext_call"))?;
+            dict.set_item(intern!(py, "command"), command)?;
             let list = PyList::empty(py);
             for arg in args {
                 list.append(arg)?;
             }
-            dict.set_item("args", list)?;
+            dict.set_item(intern!(py, "args"), list)?;
         }
         EventCompiled::AudioAction(action) => {
-            dict.set_item("type", "audio_action")?;
-            dict.set_item("channel", action.channel)?;
-            dict.set_item("action", action.action)?;
-            dict.set_item("asset", action.asset.as_deref())?;
-            dict.set_item("volume", action.volume)?;
-            dict.set_item("fade_duration_ms", action.fade_duration_ms)?;
-            dict.set_item("loop_playback", action.loop_playback)?;
+            dict.set_item(intern!(py, "type"), intern!(py, "audio_action"))?;
+            dict.set_item(intern!(py, "channel"), action.channel)?;
+            dict.set_item(intern!(py, "action"), action.action)?;
+            dict.set_item(intern!(py, "asset"), action.asset.as_deref())?;
+            dict.set_item(intern!(py, "volume"), action.volume)?;
+            dict.set_item(intern!(py, "fade_duration_ms"), action.fade_duration_ms)?;
+            dict.set_item(intern!(py, "loop_playback"), action.loop_playback)?;
         }
         EventCompiled::Transition(trans) => {
-            dict.set_item("type", "transition")?;
-            dict.set_item("kind", trans.kind)?;
-            dict.set_item("duration_ms", trans.duration_ms)?;
-            dict.set_item("color", trans.color.as_deref())?;
+            dict.set_item(intern!(py, "type"), intern!(py, "transition"))?;
+            dict.set_item(intern!(py, "kind"), trans.kind)?;
+            dict.set_item(intern!(py, "duration_ms"), trans.duration_ms)?;
+            dict.set_item(intern!(py, "color"), trans.color.as_deref())?;
         }
         EventCompiled::SetCharacterPosition(pos) => {
-            dict.set_item("type", "set_character_position")?;
-            dict.set_item("name", pos.name.as_ref())?;
-            dict.set_item("x", pos.x)?;
-            dict.set_item("y", pos.y)?;
-            dict.set_item("scale", pos.scale)?;
+            dict.set_item(intern!(py, "type"), intern!(py, "set_character_position"))?;
+            dict.set_item(intern!(py, "name"), pos.name.as_ref())?;
+            dict.set_item(intern!(py, "x"), pos.x)?;
+            dict.set_item(intern!(py, "y"), pos.y)?;
+            dict.set_item(intern!(py, "scale"), pos.scale)?;
         }
     }
     Ok(dict.into())
@@ -112,12 +127,12 @@ pub fn characters_to_python(
     let list = PyList::empty(py);
     for character in characters {
         let character_dict = PyDict::new(py);
-        character_dict.set_item("name", character.name.as_ref())?;
-        character_dict.set_item("expression", character.expression.as_deref())?;
-        character_dict.set_item("position", character.position.as_deref())?;
-        character_dict.set_item("x", character.x)?;
-        character_dict.set_item("y", character.y)?;
-        character_dict.set_item("scale", character.scale)?;
+        character_dict.set_item(intern!(py, "name"), character.name.as_ref())?;
+        character_dict.set_item(intern!(py, "expression"), character.expression.as_deref())?;
+        character_dict.set_item(intern!(py, "position"), character.position.as_deref())?;
+        character_dict.set_item(intern!(py, "x"), character.x)?;
+        character_dict.set_item(intern!(py, "y"), character.y)?;
+        character_dict.set_item(intern!(py, "scale"), character.scale)?;
         list.append(character_dict)?;
     }
     Ok(list.into())
@@ -130,9 +145,9 @@ pub fn patch_update_to_python(
     let list = PyList::empty(py);
     for character in update {
         let character_dict = PyDict::new(py);
-        character_dict.set_item("name", character.name.as_ref())?;
-        character_dict.set_item("expression", character.expression.as_deref())?;
-        character_dict.set_item("position", character.position.as_deref())?;
+        character_dict.set_item(intern!(py, "name"), character.name.as_ref())?;
+        character_dict.set_item(intern!(py, "expression"), character.expression.as_deref())?;
+        character_dict.set_item(intern!(py, "position"), character.position.as_deref())?;
         list.append(character_dict)?;
     }
     Ok(list.into())
@@ -174,3 +189,138 @@ pub fn ui_state_to_python(ui: &UiState, py: Python<'_>) -> PyResult<PyObject> {
     }
     Ok(dict.into())
 }
+
+/// Nesting limit for dict scripts, matching serde_json's recursion limit for text.
+const MAX_JSON_DEPTH: usize = 128;
+
+/// Converts plain Python data (dict/list/tuple/str/int/float/bool/None) into a
+/// JSON value without going through Python's `json` module.
+///
+/// Also returns the length of the value's compact JSON encoding, counted while
+/// converting, so callers can apply text-based size budgets without serializing.
+/// Nesting deeper than serde_json accepts for text (which includes
+/// self-referential containers) raises `ValueError`.
+pub fn python_to_json_value(obj: &Bound<'_, PyAny>) -> PyResult<(serde_json::Value, usize)> {
+    let mut encoded_len = 0;
+    let value = json_value_at_depth(obj, 0, &mut encoded_len)?;
+    Ok((value, encoded_len))
+}
+
+fn json_value_at_depth(
+    obj: &Bound<'_, PyAny>,
+    depth: usize,
+    encoded_len: &mut usize,
+) -> PyResult<serde_json::Value> {
+    if obj.is_none() {
+        *encoded_len += 4;
+        return Ok(serde_json::Value::Null);
+    }
+    // bool must be checked before int: Python bools are ints.
+    if let Ok(value) = obj.downcast::<PyBool>() {
+        let value = value.is_true();
+        *encoded_len += if value { 4 } else { 5 };
+        return Ok(serde_json::Value::Bool(value));
+    }
+    if obj.is_instance_of::<PyInt>() {
+        let number = match obj.extract::<i64>() {
+            Ok(value) => serde_json::Number::from(value),
+            Err(_) => obj.extract::<u64>()?.into(),
+        };
+        *encoded_len += number.to_string().len();
+        return Ok(serde_json::Value::Number(number));
+    }
+    if let Ok(value) = obj.downcast::<PyFloat>() {
+        let number = serde_json::Number::from_f64(value.value())
+            .ok_or_else(|| PyValueError::new_err("script values must be finite numbers"))?;
+        *encoded_len += number.to_string().len();
+        return Ok(serde_json::Value::Number(number));
+    }
+    if let Ok(value) = obj.downcast::<PyString>() {
+        let value = value.to_cow()?.into_owned();
+        *encoded_len += json_string_len(&value);
+        return Ok(serde_json::Value::String(value));
+    }
+    let depth = depth + 1;
+    if depth > MAX_JSON_DEPTH {
+        return Err(PyValueError::new_err(format!(
+            "script nesting exceeds {MAX_JSON_DEPTH} levels"
+        )));
+    }
+    if let Ok(dict) = obj.downcast::<PyDict>() {
+        let mut map = serde_json::Map::with_capacity(dict.len());
+        // Braces, plus a colon per entry and a comma between entries.
+        *encoded_len += 2 + (2 * dict.len()).saturating_sub(1);
+        for (key, value) in dict.iter() {
+            let key = json_object_key(&key)?;
+            *encoded_len += json_string_len(&key);
+            map.insert(key, json_value_at_depth(&value, depth, encoded_len)?);
+        }
+        return Ok(serde_json::Value::Object(map));
+    }
+    if let Ok(list) = obj.downcast::<PyList>() {
+        *encoded_len += 2 + list.len().saturating_sub(1);
+        return list
+            .iter()
+            .map(|item| json_value_at_depth(&item, depth, encoded_len))
+            .collect();
+    }
+    if let Ok(tuple) = obj.downcast::<PyTuple>() {
+        *encoded_len += 2 + tuple.len().saturating_sub(1);
+        return tuple
+            .iter()
+            .map(|item| json_value_at_depth(&item, depth, encoded_len))
+            .collect();
+    }
+    Err(PyTypeError::new_err(format!(
+        "unsupported script value of type {}",
+        obj.get_type().name()?
+    )))
+}
+
+/// Length of `value` as a quoted JSON string, escaped the way serde_json escapes it.
+fn json_string_len(value: &str) -> usize {
+    let escaped: usize = value
+        .bytes()
+        .map(|byte| match byte {
+            b'"' | b'\\' | b'\n' | b'\r' | b'\t' | 0x08 | 0x0c => 2,
+            0x00..=0x1f => 6,
+            _ => 1,
+        })
+        .sum();
+    escaped + 2
+}
+
+/// Converts a dict key to a JSON object key the way `json.dumps` does:
+/// str keys are kept, and int, float, bool and None keys become their JSON text.
+fn json_object_key(key: &Bound<'_, PyAny>) -> PyResult<String> {
+    if let Ok(key) = key.downcast::<PyString>() {
+        return Ok(key.to_cow()?.into_owned());
+    }
+    if key.is_none() {
+        return Ok("null".to_string());
+    }
+    if let Ok(key) = key.downcast::<PyBool>() {
+        return Ok(if key.is_true() { "true" } else { "false" }.to_string());
+    }
+    if key.is_instance_of::<PyInt>() {
+        return Ok(match key.extract::<i64>() {
+            Ok(value) => value.to_string(),
+            Err(_) => key.extract::<u64>()?.to_string(),
+        });
+    }
+    if let Ok(value) = key.downcast::<PyFloat>() {
+        let value = value.value();
+        return Ok(if value.is_nan() {
+            "NaN".to_string()
+        } else if value.is_infinite() {
+            if value > 0.0 { "Infinity" } else { "-Infinity" }.to_string()
+        } else {
+            // Python's float repr, which json.dumps uses for keys.
+            PyFloat::new(key.py(), value).repr()?.to_cow()?.into_owned()
+        });
+    }
+    Err(PyTypeError::new_err(format!(
+        "script dict keys must be str, int, float, bool or None, not {}",
+        key.get_type().name()?
+    )))
+}
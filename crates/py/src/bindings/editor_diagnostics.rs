@@ -96,6 +96,15 @@ impl PyLintSeverity {
     fn __eq__(&self, other: &Self) -> bool {
         self.inner == other.inner
     }
+
+    /// Consistent with `__eq__`, so severities can key dicts and sets.
+    fn __hash__(&self) -> u64 {
+        match self.inner {
+            LintSeverity::Error => 0,
+            LintSeverity::Warning => 1,
+            LintSeverity::Info => 2,
+        }
+    }
 }
 
 /// A validation issue found in the graph.
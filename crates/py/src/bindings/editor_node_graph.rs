@@ -33,10 +33,25 @@ impl PyNodeGraph {
         self.inner.add_node(node.into_inner(), pos)
     }
 
+    /// Adds `(node, x, y)` entries in one call and returns their ids in order.
+    fn add_nodes(&mut self, nodes: Vec<(PyStoryNode, f32, f32)>) -> Vec<u32> {
+        nodes
+            .into_iter()
+            .map(|(node, x, y)| self.add_node(node, x, y))
+            .collect()
+    }
+
     fn connect(&mut self, from_id: u32, to_id: u32) {
         self.inner.connect(from_id, to_id);
     }
 
+    /// Connects every `(from_id, to_id)` pair in one call.
+    fn connect_many(&mut self, edges: Vec<(u32, u32)>) {
+        for (from_id, to_id) in edges {
+            self.inner.connect(from_id, to_id);
+        }
+    }
+
     fn remove_node(&mut self, node_id: u32) {
         self.inner.remove_node(node_id);
     }
@@ -1,14 +1,154 @@
 use super::audio::PyAudio;
-use super::conversion::{event_to_python, ui_state_to_python};
+use super::conversion::{event_to_python, python_to_json_value, ui_state_to_python};
 use super::types::{vn_error_to_py, PyResourceConfig};
+use pyo3::intern;
 use pyo3::prelude::*;
-use pyo3::types::{PyDict, PyDictMethods, PyList, PyListMethods};
-use std::collections::BTreeSet;
+use pyo3::types::{PyBytes, PyDict, PyDictMethods, PyList, PyListMethods};
+use std::collections::hash_map::RandomState;
+use std::collections::{BTreeSet, HashMap};
+use std::hash::BuildHasher;
+use std::sync::{Mutex, OnceLock};
 use visual_novel_engine::{
-    AudioCommand, Engine as CoreEngine, EventCompiled, ResourceLimiter, ScriptRaw, SecurityPolicy,
-    UiState,
+    AudioCommand, Engine as CoreEngine, EventCompiled, ResourceLimiter, ScriptCompiled, ScriptRaw,
+    SecurityPolicy, UiState, VnError,
 };
 
+/// Event type names in tag order: `current_event_tag()` indexes into this list.
+const EVENT_TYPES: [&str; 12] = [
+    "dialogue",
+    "choice",
+    "scene",
+    "jump",
+    "set_flag",
+    "set_var",
+    "jump_if",
+    "patch",
+    "ext_call",
+    "audio_action",
+    "transition",
+    "set_character_position",
+];
+
+fn event_tag(event: &EventCompiled) -> u8 {
+    match event {
+        EventCompiled::Dialogue(_) => 0,
+        EventCompiled::Choice(_) => 1,
+        EventCompiled::Scene(_) => 2,
+        EventCompiled::Jump { .. } => 3,
+        EventCompiled::SetFlag { .. } => 4,
+        EventCompiled::SetVar { .. } => 5,
+        EventCompiled::JumpIf { .. } => 6,
+        EventCompiled::Patch(_) => 7,
+        EventCompiled::ExtCall { .. } => 8,
+        EventCompiled::AudioAction(_) => 9,
+        EventCompiled::Transition(_) => 10,
+        EventCompiled::SetCharacterPosition(_) => 11,
+    }
+}
+
+/// Maximum number of distinct scripts kept in the compiled-engine cache.
+const COMPILED_ENGINE_CACHE_LIMIT: usize = 32;
+
+/// Maximum total script JSON bytes the compiled-engine cache may stand for.
+///
+/// A compiled engine grows with its source script, so the JSON length is used
+/// as the weight of each entry; larger scripts are never cached.
+const COMPILED_ENGINE_CACHE_BYTES: usize = 8 * 1024 * 1024;
+
+struct CachedEngine {
+    /// Source text, compared on every hit so a hash collision is just a miss.
+    script_json: Box<str>,
+    engine: CoreEngine,
+    /// Value of the cache clock when the entry was last used.
+    last_used: u64,
+}
+
+/// Least-recently-used cache of freshly compiled engines, keyed by script JSON.
+///
+/// Entries are found by a randomly seeded hash of the text and confirmed
+/// against the stored text. The cached engines have not executed any event
+/// yet, so a clone is equivalent to a new parse + validation + compilation of
+/// the same input. Entries are evicted one at a time, least recently used
+/// first, until both the entry and byte limits hold.
+#[derive(Default)]
+struct CompiledEngineCache {
+    hasher: RandomState,
+    engines: HashMap<u64, CachedEngine>,
+    /// Bumped on every use; orders entries for eviction.
+    clock: u64,
+    bytes: usize,
+}
+
+impl CompiledEngineCache {
+    fn get(&mut self, script_json: &str) -> Option<CoreEngine> {
+        let hash = self.hasher.hash_one(script_json);
+        let entry = self.engines.get_mut(&hash)?;
+        if *entry.script_json != *script_json {
+            return None;
+        }
+        self.clock += 1;
+        entry.last_used = self.clock;
+        Some(entry.engine.clone())
+    }
+
+    fn insert(&mut self, script_json: &str, engine: CoreEngine) {
+        if script_json.len() > COMPILED_ENGINE_CACHE_BYTES {
+            return;
+        }
+        self.clock += 1;
+        let entry = CachedEngine {
+            script_json: script_json.into(),
+            engine,
+            last_used: self.clock,
+        };
+        self.bytes += script_json.len();
+        if let Some(replaced) = self
+            .engines
+            .insert(self.hasher.hash_one(script_json), entry)
+        {
+            self.bytes -= replaced.script_json.len();
+        }
+        while self.engines.len() > COMPILED_ENGINE_CACHE_LIMIT
+            || self.bytes > COMPILED_ENGINE_CACHE_BYTES
+        {
+            let Some(oldest) = self
+                .engines
+                .iter()
+                .min_by_key(|(_, entry)| entry.last_used)
+                .map(|(hash, _)| *hash)
+            else {
+                break;
+            };
+            if let Some(evicted) = self.engines.remove(&oldest) {
+                self.bytes -= evicted.script_json.len();
+            }
+        }
+    }
+}
+
+fn compiled_engine_cache() -> &'static Mutex<CompiledEngineCache> {
+    static CACHE: OnceLock<Mutex<CompiledEngineCache>> = OnceLock::new();
+    CACHE.get_or_init(|| Mutex::new(CompiledEngineCache::default()))
+}
+
+fn build_core_engine(script_json: &str, resource_limits: ResourceLimiter) -> PyResult<CoreEngine> {
+    if let Some(engine) = compiled_engine_cache()
+        .lock()
+        .ok()
+        .and_then(|mut cache| cache.get(script_json))
+    {
+        return Ok(engine);
+    }
+    let script =
+        ScriptRaw::from_json_with_limits(script_json, resource_limits).map_err(vn_error_to_py)?;
+    let engine = CoreEngine::new(script, SecurityPolicy::default(), resource_limits)
+        .map_err(vn_error_to_py)?;
+    if let Ok(mut cache) = compiled_engine_cache().lock() {
+        cache.insert(script_json, engine.clone());
+    }
+    Ok(engine)
+}
+
 #[pyclass(name = "Engine")]
 #[derive(Debug)]
 pub struct PyEngine {
@@ -35,20 +175,43 @@ impl PyEngine {
     #[new]
     pub fn new(script_json: &str) -> PyResult<Self> {
         let resource_limits = ResourceLimiter::default();
-        let script = ScriptRaw::from_json_with_limits(script_json, resource_limits)
+        let inner = build_core_engine(script_json, resource_limits)?;
+        Ok(Self::from_core(inner, resource_limits))
+    }
+
+    /// Builds an engine from a script given as a Python dict.
+    ///
+    /// The dict is deserialized straight into the script without JSON text in
+    /// between, and goes through the same validation and limits as `new`.
+    /// Non-str dict keys are converted the way `json.dumps` converts them.
+    #[staticmethod]
+    fn from_dict(script: &Bound<'_, PyAny>) -> PyResult<Self> {
+        let resource_limits = ResourceLimiter::default();
+        let (payload, encoded_len) = python_to_json_value(script)?;
+        let script = ScriptRaw::from_json_value_with_limits(payload, encoded_len, resource_limits)
             .map_err(vn_error_to_py)?;
         let inner = CoreEngine::new(script, SecurityPolicy::default(), resource_limits)
             .map_err(vn_error_to_py)?;
-        Ok(Self {
-            inner,
-            resource_limits,
-            max_texture_memory: 512 * 1024 * 1024,
-            prefetch_depth: 0,
-            handler: None,
-            allowed_ext_call_commands: BTreeSet::new(),
-            last_ext_call_error: None,
-            last_audio_commands: Vec::new(),
-        })
+        Ok(Self::from_core(inner, resource_limits))
+    }
+
+    /// Builds an engine from a compiled script blob produced by `compiled_bytes()`.
+    ///
+    /// Skips JSON parsing and compilation; the blob is still checksum-verified
+    /// and validated against the default security policy.
+    #[staticmethod]
+    fn from_compiled_bytes(data: &[u8]) -> PyResult<Self> {
+        let resource_limits = ResourceLimiter::default();
+        let script = ScriptCompiled::from_binary(data).map_err(vn_error_to_py)?;
+        let inner = CoreEngine::from_compiled(script, SecurityPolicy::default(), resource_limits)
+            .map_err(vn_error_to_py)?;
+        Ok(Self::from_core(inner, resource_limits))
+    }
+
+    /// Returns the loaded script in the compiled binary format (`.vnsc`).
+    fn compiled_bytes<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyBytes>> {
+        let bytes = self.inner.script().to_binary().map_err(vn_error_to_py)?;
+        Ok(PyBytes::new(py, &bytes))
     }
 
     fn current_event<'py>(&self, py: Python<'py>) -> PyResult<PyObject> {
@@ -57,28 +220,7 @@ impl PyEngine {
     }
 
     fn step<'py>(&mut self, py: Python<'py>) -> PyResult<StepResult> {
-        let (audio, change) = self.inner.step().map_err(vn_error_to_py)?;
-        self.last_audio_commands = audio;
-        let event = change.event;
-        if let EventCompiled::ExtCall { command, args } = &event {
-            if !self.allowed_ext_call_commands.contains(command.as_str()) {
-                self.last_ext_call_error =
-                    Some(format!("ext_call '{command}' denied by capability policy"));
-            } else if let Some(handler) = &self.handler {
-                let handler = handler.clone_ref(py);
-                if let Err(e) = handler.call1(py, (command.as_str(), args.clone())) {
-                    let msg = format!("ExtCall handler error for '{command}': {e}");
-                    self.last_ext_call_error = Some(msg.clone());
-                    return Err(pyo3::exceptions::PyRuntimeError::new_err(msg));
-                }
-                self.last_ext_call_error = None;
-            } else {
-                self.last_ext_call_error = None;
-            }
-        } else {
-            self.last_ext_call_error = None;
-        }
-        let event_obj = event_to_python(&event, py)?;
+        let event_obj = self.step_and_dispatch(py)?;
         let audio_obj = self.get_last_audio_commands(py)?;
         Ok(StepResult {
             event: event_obj,
@@ -86,6 +228,32 @@ impl PyEngine {
         })
     }
 
+    /// Steps through events until a choice, an ext-call, or the end of the script.
+    ///
+    /// Returns the processed events as a list of dicts in one call. A pending
+    /// choice is left as the current event; an ext-call is dispatched once and
+    /// ends the batch because it blocks until `resume()`. Audio commands from
+    /// every processed event are available through `get_last_audio_commands`.
+    fn drain_until_choice<'py>(&mut self, py: Python<'py>) -> PyResult<PyObject> {
+        let events = PyList::empty(py);
+        let mut audio = Vec::new();
+        loop {
+            let blocks_after_step = match self.inner.current_event_ref() {
+                Ok(EventCompiled::Choice(_)) | Err(VnError::EndOfScript) => break,
+                Ok(EventCompiled::ExtCall { .. }) => true,
+                Ok(_) => false,
+                Err(err) => return Err(vn_error_to_py(err)),
+            };
+            events.append(self.step_and_dispatch(py)?)?;
+            audio.append(&mut self.last_audio_commands);
+            if blocks_after_step {
+                break;
+            }
+        }
+        self.last_audio_commands = audio;
+        Ok(events.into())
+    }
+
     fn choose<'py>(&mut self, py: Python<'py>, option_index: usize) -> PyResult<PyObject> {
         let event = self.inner.choose(option_index).map_err(vn_error_to_py)?;
         event_to_python(&event, py)
@@ -96,39 +264,45 @@ impl PyEngine {
     }
 
     fn supported_event_types(&self) -> Vec<&'static str> {
-        vec![
-            "dialogue",
-            "choice",
-            "scene",
-            "jump",
-            "set_flag",
-            "set_var",
-            "jump_if",
-            "patch",
-            "ext_call",
-            "audio_action",
-            "transition",
-            "set_character_position",
-        ]
+        EVENT_TYPES.to_vec()
     }
 
+    /// Returns the current event type as an index into `supported_event_types()`.
+    ///
+    /// Lets callers branch on the event kind without building the event dict.
+    fn current_event_tag(&self) -> PyResult<u8> {
+        self.inner
+            .current_event_ref()
+            .map(event_tag)
+            .map_err(vn_error_to_py)
+    }
+
+    /// Returns the current visual state as a new dict.
+    ///
+    /// Keys are interned, so polling every frame only allocates the dicts and
+    /// the value strings.
     fn visual_state<'py>(&self, py: Python<'py>) -> PyResult<PyObject> {
         let state = self.inner.visual_state();
         let dict = PyDict::new(py);
-        dict.set_item("background", state.background.as_deref())?;
-        dict.set_item("music", state.music.as_deref())?;
+        dict.set_item(intern!(py, "background"), state.background.as_deref())?;
+        dict.set_item(intern!(py, "music"), state.music.as_deref())?;
         let characters = PyList::empty(py);
         for character in &state.characters {
             let character_dict = PyDict::new(py);
-            character_dict.set_item("name", character.name.as_ref())?;
-            character_dict.set_item("expression", character.expression.as_deref())?;
-            character_dict.set_item("position", character.position.as_deref())?;
+            character_dict.set_item(intern!(py, "name"), character.name.as_ref())?;
+            character_dict.set_item(intern!(py, "expression"), character.expression.as_deref())?;
+            character_dict.set_item(intern!(py, "position"), character.position.as_deref())?;
             characters.append(character_dict)?;
         }
-        dict.set_item("characters", characters)?;
+        dict.set_item(intern!(py, "characters"), characters)?;
         Ok(dict.into())
     }
 
+    /// Returns whether the script has no current event left to process.
+    fn is_finished(&self) -> bool {
+        matches!(self.inner.current_event_ref(), Err(VnError::EndOfScript))
+    }
+
     fn is_current_dialogue_read(&self) -> bool {
         self.inner.is_current_dialogue_read()
     }
@@ -256,6 +430,21 @@ impl PyEngine {
         self.last_ext_call_error.clone()
     }
 
+    /// Restarts the script without re-parsing it, optionally at a label.
+    ///
+    /// Flags, variables, visuals and session history return to their initial
+    /// values; handlers and ext-call capabilities are kept.
+    #[pyo3(signature = (to_label=None))]
+    fn reset(&mut self, to_label: Option<&str>) -> PyResult<()> {
+        self.inner.reset();
+        self.last_audio_commands.clear();
+        self.last_ext_call_error = None;
+        if let Some(label) = to_label {
+            self.inner.jump_to_label(label).map_err(vn_error_to_py)?;
+        }
+        Ok(())
+    }
+
     fn resume(&mut self) -> PyResult<()> {
         self.inner.resume().map_err(vn_error_to_py)?;
         Ok(())
@@ -268,9 +457,51 @@ impl PyEngine {
     }
 }
 
+impl PyEngine {
+    fn from_core(inner: CoreEngine, resource_limits: ResourceLimiter) -> Self {
+        Self {
+            inner,
+            resource_limits,
+            max_texture_memory: 512 * 1024 * 1024,
+            prefetch_depth: 0,
+            handler: None,
+            allowed_ext_call_commands: BTreeSet::new(),
+            last_ext_call_error: None,
+            last_audio_commands: Vec::new(),
+        }
+    }
+
+    /// Advances the core engine one event, dispatching ext-calls to the handler.
+    fn step_and_dispatch(&mut self, py: Python<'_>) -> PyResult<PyObject> {
+        let (audio, change) = self.inner.step().map_err(vn_error_to_py)?;
+        self.last_audio_commands = audio;
+        let event = change.event;
+        if let EventCompiled::ExtCall { command, args } = &event {
+            if !self.allowed_ext_call_commands.contains(command.as_str()) {
+                self.last_ext_call_error =
+                    Some(format!("ext_call '{command}' denied by capability policy"));
+            } else if let Some(handler) = &self.handler {
+                let handler = handler.clone_ref(py);
+                if let Err(e) = handler.call1(py, (command.as_str(), args.clone())) {
+                    let msg = format!("ExtCall handler error for '{command}': {e}");
+                    self.last_ext_call_error = Some(msg.clone());
+                    return Err(pyo3::exceptions::PyRuntimeError::new_err(msg));
+                }
+                self.last_ext_call_error = None;
+            } else {
+                self.last_ext_call_error = None;
+            }
+        } else {
+            self.last_ext_call_error = None;
+        }
+        event_to_python(&event, py)
+    }
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
+    use pyo3::exceptions::PyValueError;
     use pyo3::ffi::c_str;
     use pyo3::types::PyModule;
 
@@ -286,6 +517,272 @@ mod tests {
         PyEngine::new(script_json).expect("engine should build")
     }
 
+    #[test]
+    fn engines_built_from_cached_script_start_fresh() {
+        pyo3::prepare_freethreaded_python();
+        Python::with_gil(|py| {
+            let mut first = make_ext_call_engine();
+            first.resume().expect("resume after ext-call");
+            let _ = first.step(py).expect("dialogue should step");
+
+            let second = make_ext_call_engine();
+            assert_eq!(second.inner.state().position, 0);
+            assert_eq!(
+                second.current_event_json().expect("current event"),
+                make_ext_call_engine()
+                    .current_event_json()
+                    .expect("current event")
+            );
+        });
+    }
+
+    #[test]
+    fn compiled_engine_cache_evicts_least_recently_used_entries() {
+        let engine = make_ext_call_engine().inner;
+        let mut cache = CompiledEngineCache::default();
+        for id in 0..COMPILED_ENGINE_CACHE_LIMIT {
+            cache.insert(&id.to_string(), engine.clone());
+        }
+        assert!(cache.get("0").is_some());
+        cache.insert("99", engine.clone());
+        assert_eq!(cache.engines.len(), COMPILED_ENGINE_CACHE_LIMIT);
+        assert!(cache.get("0").is_some(), "recently used entry is kept");
+        assert!(
+            cache.get("1").is_none(),
+            "least recently used entry is evicted"
+        );
+
+        let largest = "a".repeat(COMPILED_ENGINE_CACHE_BYTES);
+        cache.insert(&largest, engine.clone());
+        assert_eq!(cache.engines.len(), 1);
+        assert_eq!(cache.bytes, COMPILED_ENGINE_CACHE_BYTES);
+        let too_large = "a".repeat(COMPILED_ENGINE_CACHE_BYTES + 1);
+        cache.insert(&too_large, engine);
+        assert!(cache.get(&too_large).is_none());
+    }
+
+    #[test]
+    fn compiled_engine_cache_treats_hash_collisions_as_misses() {
+        let engine = make_ext_call_engine().inner;
+        let mut cache = CompiledEngineCache::default();
+        cache.insert("other script", engine);
+        // Pretend "script" collides with the cached entry's hash.
+        let entry = cache
+            .engines
+            .drain()
+            .map(|(_, entry)| entry)
+            .next()
+            .expect("cached entry");
+        let hash = cache.hasher.hash_one("script");
+        cache.engines.insert(hash, entry);
+        assert!(cache.get("script").is_none());
+    }
+
+    #[test]
+    fn from_dict_matches_an_engine_built_from_json() {
+        pyo3::prepare_freethreaded_python();
+        Python::with_gil(|py| {
+            let script = py
+                .eval(
+                    c_str!(
+                        r#"{
+    "script_schema_version": "1.0",
+    "events": [
+        {"type": "ext_call", "command": "minigame_start", "args": ("cards",)},
+        {"type": "dialogue", "speaker": "Narrator", "text": "Next"},
+    ],
+    "labels": {"start": 0},
+}"#
+                    ),
+                    None,
+                    None,
+                )
+                .expect("script dict");
+            let engine = PyEngine::from_dict(&script).expect("engine from dict");
+            assert_eq!(
+                engine.current_event_json().expect("current event"),
+                make_ext_call_engine()
+                    .current_event_json()
+                    .expect("current event")
+            );
+
+            let int_label = py
+                .eval(
+                    c_str!(
+                        r#"{
+    "events": [{"type": "jump", "target": "7"}],
+    "labels": {"start": 0, 7: 0},
+}"#
+                    ),
+                    None,
+                    None,
+                )
+                .expect("dict with an int label key");
+            assert!(PyEngine::from_dict(&int_label).is_ok());
+
+            let invalid = py.eval(c_str!("{1: 2}"), None, None).expect("dict");
+            assert!(PyEngine::from_dict(&invalid).is_err());
+        });
+    }
+
+    #[test]
+    fn from_dict_rejects_deep_and_self_referential_scripts() {
+        pyo3::prepare_freethreaded_python();
+        Python::with_gil(|py| {
+            let mut events = PyList::empty(py);
+            for _ in 0..200 {
+                let outer = PyList::empty(py);
+                outer.append(events).expect("append");
+                events = outer;
+            }
+            let deep = PyDict::new(py);
+            deep.set_item("events", events).expect("events");
+            let err = PyEngine::from_dict(&deep).expect_err("nesting limit");
+            assert!(err.is_instance_of::<PyValueError>(py));
+
+            let cyclic = PyDict::new(py);
+            cyclic.set_item("events", &cyclic).expect("self reference");
+            let err = PyEngine::from_dict(&cyclic).expect_err("cycle");
+            assert!(err.is_instance_of::<PyValueError>(py));
+        });
+    }
+
+    #[test]
+    fn python_to_json_value_counts_the_compact_encoding() {
+        pyo3::prepare_freethreaded_python();
+        Python::with_gil(|py| {
+            let value = py
+                .eval(
+                    c_str!(
+                        r#"{"a": [1, -2.5, None, True, False, ()], 3: "q\"\n\u0001é", "e": {}}"#
+                    ),
+                    None,
+                    None,
+                )
+                .expect("dict");
+            let (json, encoded_len) = python_to_json_value(&value).expect("convert");
+            assert_eq!(
+                encoded_len,
+                serde_json::to_string(&json).expect("json").len()
+            );
+        });
+    }
+
+    #[test]
+    fn compiled_bytes_roundtrip_restores_the_script() {
+        pyo3::prepare_freethreaded_python();
+        Python::with_gil(|py| {
+            let engine = make_ext_call_engine();
+            let blob = engine.compiled_bytes(py).expect("compiled bytes");
+            let restored =
+                PyEngine::from_compiled_bytes(blob.as_bytes()).expect("engine from blob");
+            assert_eq!(
+                restored.current_event_json().expect("current event"),
+                engine.current_event_json().expect("current event")
+            );
+        });
+    }
+
+    #[test]
+    fn drain_until_choice_stops_before_pending_choice() {
+        pyo3::prepare_freethreaded_python();
+        Python::with_gil(|py| {
+            let script_json = r#"{
+  "script_schema_version": "1.0",
+  "events": [
+    { "type": "dialogue", "speaker": "Ava", "text": "Hola" },
+    { "type": "set_flag", "key": "seen", "value": true },
+    { "type": "choice", "prompt": "Ir?", "options": [{ "text": "Si", "target": "start" }] }
+  ],
+  "labels": { "start": 0 }
+}"#;
+            let mut engine = PyEngine::new(script_json).expect("engine should build");
+            let drained = engine.drain_until_choice(py).expect("drain should succeed");
+            let drained = drained.bind(py).downcast::<PyList>().expect("list").clone();
+            assert_eq!(drained.len(), 2);
+            assert!(engine
+                .current_event_json()
+                .expect("pending")
+                .contains("choice"));
+        });
+    }
+
+    #[test]
+    fn reset_restarts_the_script_at_a_label() {
+        pyo3::prepare_freethreaded_python();
+        Python::with_gil(|py| {
+            let mut engine = make_ext_call_engine();
+            engine.resume().expect("resume after ext-call");
+            let _ = engine.step(py).expect("dialogue should step");
+            assert!(engine.is_finished());
+
+            engine.reset(None).expect("reset");
+            assert_eq!(engine.inner.state().position, 0);
+            engine.reset(Some("start")).expect("reset to label");
+            assert_eq!(engine.inner.state().position, 0);
+            assert!(engine.reset(Some("missing")).is_err());
+        });
+    }
+
+    #[test]
+    fn current_event_tag_indexes_supported_event_types() {
+        let engine = make_ext_call_engine();
+        let tag = engine.current_event_tag().expect("current event tag");
+        assert_eq!(engine.supported_event_types()[tag as usize], "ext_call");
+    }
+
+    #[test]
+    fn is_finished_reports_the_end_of_the_script() {
+        pyo3::prepare_freethreaded_python();
+        Python::with_gil(|py| {
+            let mut engine = make_ext_call_engine();
+            assert!(!engine.is_finished());
+            engine.resume().expect("resume after ext-call");
+            let _ = engine.step(py).expect("dialogue should step");
+            assert!(engine.is_finished());
+        });
+    }
+
+    #[test]
+    fn visual_state_returns_new_dicts_that_follow_the_engine() {
+        pyo3::prepare_freethreaded_python();
+        Python::with_gil(|py| {
+            let script_json = r#"{
+  "script_schema_version": "1.0",
+  "events": [
+    { "type": "scene", "background": "bg/room.png", "music": null, "characters": [] },
+    { "type": "scene", "background": "bg/night.png", "music": null, "characters": [] }
+  ],
+  "labels": { "start": 0 }
+}"#;
+            let mut engine = PyEngine::new(script_json).expect("engine should build");
+            let _ = engine.step(py).expect("scene should step");
+            let first = engine.visual_state(py).expect("visual state");
+            first
+                .bind(py)
+                .set_item("background", "edited.png")
+                .expect("callers may edit their copy");
+            let again = engine.visual_state(py).expect("visual state");
+            assert!(!first.is(&again));
+            let background: String = again
+                .bind(py)
+                .get_item("background")
+                .and_then(|value| value.extract())
+                .expect("background");
+            assert_eq!(background, "bg/room.png");
+
+            let _ = engine.step(py).expect("scene should step");
+            let stepped = engine.visual_state(py).expect("visual state");
+            assert!(!stepped.is(&first));
+            let background: String = stepped
+                .bind(py)
+                .get_item("background")
+                .and_then(|value| value.extract())
+                .expect("background");
+            assert_eq!(background, "bg/night.png");
+        });
+    }
+
     #[test]
     fn ext_call_callbacks_are_denied_by_default() {
         pyo3::prepare_freethreaded_python();
@@ -2,10 +2,11 @@
 Ejemplo básico de uso del motor sin interfaz gráfica.
 
 Demuestra cómo:
-- Crear un engine desde un script JSON
+- Crear un engine desde un script (dict de Python)
 - Avanzar por eventos
 - Manejar elecciones
 - Consultar el estado visual
+- Reiniciar la partida sin volver a parsear el script
 
 Ejecutar con: python examples/python/basic_engine.py
 
@@ -17,35 +18,50 @@ from __future__ import annotations
 
 from visual_novel_engine import PyEngine
 
-SCRIPT_JSON = """
-{
+SCRIPT = {
     "script_schema_version": "1.0",
     "events": [
-    {"type": "scene", "background": "bg/sala.png", "music": null, "characters": [
-      {"name": "Ava", "expression": "neutral", "position": "center"}
-    ]},
-    {"type": "dialogue", "speaker": "Ava", "text": "Hola, bienvenido."},
-    {"type": "set_flag", "key": "saludo_visto", "value": true},
-    {"type": "set_var", "key": "contador", "value": 0},
-    {"type": "jump_if", "cond": {"kind": "var_cmp", "key": "contador", "op": "gt", "value": 2}, "target": "amable"},
-    {"type": "choice", "prompt": "¿Qué respondes?", "options": [
-      {"text": "Hola, ¿cómo estás?", "target": "amable"},
-      {"text": "No tengo tiempo.", "target": "end"}
-    ]},
-    {"type": "dialogue", "speaker": "Ava", "text": "¡Qué amable! Estoy bien, gracias."},
-    {"type": "jump", "target": "end"},
-    {"type": "dialogue", "speaker": "Ava", "text": "Entiendo. Hasta luego."}
-  ],
-  "labels": {"start": 0, "amable": 6, "end": 8}
+        {
+            "type": "scene",
+            "background": "bg/sala.png",
+            "music": None,
+            "characters": [
+                {"name": "Ava", "expression": "neutral", "position": "center"}
+            ],
+        },
+        {"type": "dialogue", "speaker": "Ava", "text": "Hola, bienvenido."},
+        {"type": "set_flag", "key": "saludo_visto", "value": True},
+        {"type": "set_var", "key": "contador", "value": 0},
+        {
+            "type": "jump_if",
+            "cond": {"kind": "var_cmp", "key": "contador", "op": "gt", "value": 2},
+            "target": "amable",
+        },
+        {
+            "type": "choice",
+            "prompt": "¿Qué respondes?",
+            "options": [
+                {"text": "Hola, ¿cómo estás?", "target": "amable"},
+                {"text": "No tengo tiempo.", "target": "end"},
+            ],
+        },
+        {
+            "type": "dialogue",
+            "speaker": "Ava",
+            "text": "¡Qué amable! Estoy bien, gracias.",
+        },
+        {"type": "jump", "target": "end"},
+        {"type": "dialogue", "speaker": "Ava", "text": "Entiendo. Hasta luego."},
+    ],
+    "labels": {"start": 0, "amable": 6, "end": 8},
 }
-"""
 
 
 def main() -> None:
     print("=== Demo del Motor de Novelas Visuales ===\n")
 
-    # Crear el motor
-    engine = PyEngine(SCRIPT_JSON)
+    # Crear el motor directamente desde el dict, sin pasar por texto JSON
+    engine = PyEngine.from_dict(SCRIPT)
 
     # Mostrar evento inicial (Scene)
     print("1. Evento inicial:")
@@ -80,6 +96,11 @@ def main() -> None:
     print("\n6. Después de elegir opción 0:")
     print(f"   {engine.current_event()}")
 
+    # Reiniciar para explorar otra rama sin volver a crear el motor
+    engine.reset(to_label="end")
+    print("\n7. Después de reset(to_label='end'):")
+    print(f"   {engine.current_event()}")
+
     print("\n=== Demo completada ===")
 
 
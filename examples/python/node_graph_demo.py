@@ -9,12 +9,23 @@ Usage:
     python node_graph_demo.py
 """
 
-from visual_novel_engine import NodeGraph, StoryNode, py_validate_graph
+import logging
+import sys
+
+from visual_novel_engine import LintSeverity, NodeGraph, StoryNode, py_validate_graph
+
+SEVERITY_ICONS = {
+    LintSeverity.Error: "❌",
+    LintSeverity.Warning: "⚠️",
+    LintSeverity.Info: "ℹ️",
+}
+
+log = logging.getLogger(__name__)
 
 
 def create_simple_story():
     """Creates a simple linear story."""
-    print("=== Creating Simple Story ===")
+    log.info("=== Creating Simple Story ===")
 
     graph = NodeGraph()
 
@@ -35,108 +46,118 @@ def create_simple_story():
     graph.connect(dialogue1, dialogue2)
     graph.connect(dialogue2, end)
 
-    print(f"Created graph: {graph}")
-    print(f"  Nodes: {graph.node_count()}")
-    print(f"  Connections: {graph.connection_count()}")
+    log.info("Created graph: %s", graph)
+    log.info("  Nodes: %s", graph.node_count())
+    log.info("  Connections: %s", graph.connection_count())
 
     return graph
 
 
 def create_branching_story():
     """Creates a branching story with choices."""
-    print("\n=== Creating Branching Story ===")
+    log.info("\n=== Creating Branching Story ===")
 
     graph = NodeGraph()
 
-    # Setup
-    start = graph.add_node(StoryNode.start(), 0, 0)
-    intro = graph.add_node(
-        StoryNode.dialogue("Narrator", "You find yourself at a crossroads."), 0, 100
-    )
-
-    # Choice
-    choice = graph.add_node(
-        StoryNode.choice(
-            "Which path do you take?",
-            ["Go left into the forest", "Go right to the mountains"],
-        ),
-        0,
-        200,
+    # Add all nodes in one call; ids come back in the same order.
+    (
+        start,
+        intro,
+        choice,
+        left_scene,
+        left_dialogue,
+        right_scene,
+        right_dialogue,
+        end1,
+        end2,
+    ) = graph.add_nodes(
+        [
+            # Setup
+            (StoryNode.start(), 0, 0),
+            (
+                StoryNode.dialogue("Narrator", "You find yourself at a crossroads."),
+                0,
+                100,
+            ),
+            # Choice
+            (
+                StoryNode.choice(
+                    "Which path do you take?",
+                    ["Go left into the forest", "Go right to the mountains"],
+                ),
+                0,
+                200,
+            ),
+            # Left path
+            (StoryNode.scene("forest.png"), -150, 300),
+            (StoryNode.dialogue("Forest Spirit", "Welcome, traveler."), -150, 400),
+            # Right path
+            (StoryNode.scene("mountains.png"), 150, 300),
+            (StoryNode.dialogue("Mountain Guide", "The peak awaits!"), 150, 400),
+            # Endings
+            (StoryNode.end(), -150, 500),
+            (StoryNode.end(), 150, 500),
+        ]
     )
 
-    # Left path
-    left_scene = graph.add_node(StoryNode.scene("forest.png"), -150, 300)
-    left_dialogue = graph.add_node(
-        StoryNode.dialogue("Forest Spirit", "Welcome, traveler."), -150, 400
-    )
-
-    # Right path
-    right_scene = graph.add_node(StoryNode.scene("mountains.png"), 150, 300)
-    right_dialogue = graph.add_node(
-        StoryNode.dialogue("Mountain Guide", "The peak awaits!"), 150, 400
-    )
-
-    # Endings
-    end1 = graph.add_node(StoryNode.end(), -150, 500)
-    end2 = graph.add_node(StoryNode.end(), 150, 500)
-
     # Connections
-    graph.connect(start, intro)
-    graph.connect(intro, choice)
-    graph.connect(choice, left_scene)  # First option
-    graph.connect(choice, right_scene)  # Second option
-    graph.connect(left_scene, left_dialogue)
-    graph.connect(left_dialogue, end1)
-    graph.connect(right_scene, right_dialogue)
-    graph.connect(right_dialogue, end2)
+    graph.connect_many(
+        [
+            (start, intro),
+            (intro, choice),
+            (choice, left_scene),  # First option
+            (choice, right_scene),  # Second option
+            (left_scene, left_dialogue),
+            (left_dialogue, end1),
+            (right_scene, right_dialogue),
+            (right_dialogue, end2),
+        ]
+    )
 
-    print(f"Created graph: {graph}")
+    log.info("Created graph: %s", graph)
 
     return graph
 
 
 def validate_story(graph):
     """Validates a story graph for issues."""
-    print("\n=== Validating Story ===")
+    log.info("\n=== Validating Story ===")
 
     issues = py_validate_graph(graph)
 
     if not issues:
-        print("✓ No issues found!")
+        log.info("✓ No issues found!")
         return True
 
+    has_errors = False
     for issue in issues:
-        severity_icon = {
-            "LintSeverity.Error": "❌",
-            "LintSeverity.Warning": "⚠️",
-            "LintSeverity.Info": "ℹ️",
-        }.get(str(issue.severity), "?")
+        severity = issue.severity
+        if severity == LintSeverity.Error:
+            has_errors = True
 
-        print(f"{severity_icon} {issue.message}")
+        log.info("%s %s", SEVERITY_ICONS.get(severity, "?"), issue.message)
         if issue.node_id is not None:
-            print(f"   at node {issue.node_id}")
+            log.info("   at node %s", issue.node_id)
 
-    # Check for errors
-    has_errors = any(str(issue.severity) == "LintSeverity.Error" for issue in issues)
     return not has_errors
 
 
 def save_and_load_demo(graph):
     """Demonstrates saving and loading a graph."""
-    print("\n=== Save/Load Demo ===")
+    log.info("\n=== Save/Load Demo ===")
 
     # Save to file
     filepath = "demo_story.json"
     graph.save(filepath)
-    print(f"Saved to {filepath}")
+    log.info("Saved to %s", filepath)
 
     # Load from file
     loaded_graph = NodeGraph.load(filepath)
-    print(f"Loaded: {loaded_graph}")
+    log.info("Loaded: %s", loaded_graph)
 
     # Verify
     assert graph.node_count() == loaded_graph.node_count()
-    print("✓ Save/Load verified!")
+    log.info("✓ Save/Load verified!")
 
     # Cleanup
     import os
@@ -146,7 +167,7 @@ def save_and_load_demo(graph):
 
 def create_invalid_story():
     """Creates a story with validation issues for demo."""
-    print("\n=== Creating Invalid Story (for validation demo) ===")
+    log.info("\n=== Creating Invalid Story (for validation demo) ===")
 
     graph = NodeGraph()
 
@@ -155,14 +176,14 @@ def create_invalid_story():
 
     # Missing End - this will be a warning
 
-    print(f"Created graph: {graph}")
+    log.info("Created graph: %s", graph)
     return graph
 
 
 def main():
     """Main demo function."""
-    print("Node Graph Python API Demo")
-    print("=" * 40)
+    log.info("Node Graph Python API Demo")
+    log.info("%s", "=" * 40)
 
     # Demo 1: Simple story
     simple = create_simple_story()
@@ -177,9 +198,10 @@ def main():
     invalid = create_invalid_story()
     validate_story(invalid)
 
-    print("\n" + "=" * 40)
-    print("Demo complete!")
+    log.info("\n%s", "=" * 40)
+    log.info("Demo complete!")
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     main()
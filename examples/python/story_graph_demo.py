@@ -6,8 +6,13 @@ Demonstrates how to generate and analyze a story graph from a script,
 including detecting unreachable nodes and exporting to DOT format.
 """
 
+import logging
+import sys
+
 import visual_novel_engine as vn
 
+log = logging.getLogger(__name__)
+
 
 # Sample script with branching and an unreachable node
 SCRIPT_JSON = """{
@@ -66,66 +71,67 @@ SCRIPT_JSON = """{
 
 
 def main():
-    print("=== Story Graph Analysis Example ===\n")
+    log.info("=== Story Graph Analysis Example ===\n")
 
     # Generate the story graph
     graph = vn.StoryGraph.from_json(SCRIPT_JSON)
-    print(f"Generated: {graph}")
+    log.info("Generated: %s", graph)
 
     # Get statistics
     stats = graph.stats()
-    print("\n--- Graph Statistics ---")
-    print(f"  Total nodes:      {stats.total_nodes}")
-    print(f"  Reachable nodes:  {stats.reachable_nodes}")
-    print(f"  Unreachable nodes: {stats.unreachable_nodes}")
-    print(f"  Dialogues:        {stats.dialogue_count}")
-    print(f"  Choices:          {stats.choice_count}")
-    print(f"  Branch points:    {stats.branch_count}")
-    print(f"  Edges:            {stats.edge_count}")
+    log.info("\n--- Graph Statistics ---")
+    log.info("  Total nodes:      %s", stats.total_nodes)
+    log.info("  Reachable nodes:  %s", stats.reachable_nodes)
+    log.info("  Unreachable nodes: %s", stats.unreachable_nodes)
+    log.info("  Dialogues:        %s", stats.dialogue_count)
+    log.info("  Choices:          %s", stats.choice_count)
+    log.info("  Branch points:    %s", stats.branch_count)
+    log.info("  Edges:            %s", stats.edge_count)
 
     # Check for unreachable nodes (dead code detection)
     unreachable = graph.unreachable_nodes()
     if unreachable:
-        print(f"\n⚠️  Unreachable nodes detected: {unreachable}")
+        log.info("\n⚠️  Unreachable nodes detected: %s", unreachable)
         for node in graph.nodes():
             if node.id in unreachable:
-                print(f"  Node {node.id}: {node.node_type} - {node.details}")
+                log.info("  Node %s: %s - %s", node.id, node.node_type, node.details)
     else:
-        print("\n✓ All nodes are reachable!")
+        log.info("\n✓ All nodes are reachable!")
 
     # List all nodes
-    print("\n--- Nodes ---")
+    log.info("\n--- Nodes ---")
     for node in graph.nodes():
         status = "✓" if node.reachable else "✗"
-        labels = f" [{', '.join(node.labels)}]" if node.labels else ""
-        print(f"  {status} Node {node.id}{labels}: {node.node_type}")
+        labels = " [%s]" % ", ".join(node.labels) if node.labels else ""
+        log.info("  %s Node %s%s: %s", status, node.id, labels, node.node_type)
 
     # List all edges
-    print("\n--- Edges ---")
+    log.info("\n--- Edges ---")
     for edge in graph.edges():
-        label = f' "{edge.label}"' if edge.label else ""
-        print(f"  {edge.from_id} -> {edge.to_id}: {edge.edge_type}{label}")
+        label = ' "%s"' % edge.label if edge.label else ""
+        log.info("  %s -> %s: %s%s", edge.from_id, edge.to_id, edge.edge_type, label)
 
     # Find nodes by label
-    print("\n--- Label Lookup ---")
+    log.info("\n--- Label Lookup ---")
     for label in ["start", "forest", "secret", "nonexistent"]:
         node_id = graph.find_by_label(label)
         if node_id is not None:
-            print(f"  '{label}' -> Node {node_id}")
+            log.info("  '%s' -> Node %s", label, node_id)
         else:
-            print(f"  '{label}' -> Not found")
+            log.info("  '%s' -> Not found", label)
 
     # Export to DOT format for Graphviz visualization
-    print("\n--- DOT Export ---")
+    log.info("\n--- DOT Export ---")
     dot_content = graph.to_dot()
-    print(dot_content)
+    log.info("%s", dot_content)
 
     # Save DOT file
     with open("story_graph.dot", "w") as f:
         f.write(dot_content)
-    print("\nSaved to 'story_graph.dot'")
-    print("Generate PNG with: dot -Tpng story_graph.dot -o story_graph.png")
+    log.info("\nSaved to 'story_graph.dot'")
+    log.info("Generate PNG with: dot -Tpng story_graph.dot -o story_graph.png")
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     main()
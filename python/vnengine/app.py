@@ -2,24 +2,41 @@
 
 from __future__ import annotations
 
-from typing import Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional
 
 from .engine import Engine
 
+Chooser = Callable[[Dict[str, object]], int]
+
+
+def _handle_choice(
+    engine: Any, event: Dict[str, object], chooser: Optional[Chooser]
+) -> None:
+    engine.choose(chooser(event) if chooser else 0)
+
+
+# Per-event-type handlers for `EngineApp.run`; unlisted types just step.
+_HANDLERS: Dict[str, Callable[[Any, Dict[str, object], Optional[Chooser]], None]] = {
+    "choice": _handle_choice,
+}
+
+# Methods `EngineApp.run` batches through; engines lacking any use the
+# current_event/step/choose loop instead.
+_BATCH_METHODS = ("drain_until_choice", "is_finished", "current_event_type")
+
 
 class EngineApp:
     """Drive an engine until completion.
 
     Args:
-        engine: Engine instance to run.
+        engine: Engine instance to run. Other objects work as long as they
+            provide ``current_event``, ``step`` and ``choose``.
     """
 
     def __init__(self, engine: Engine) -> None:
         self.engine = engine
 
-    def run(
-        self, chooser: Optional[Callable[[Dict[str, object]], int]] = None
-    ) -> List[Dict[str, object]]:
+    def run(self, chooser: Optional[Chooser] = None) -> List[Dict[str, object]]:
         """Run the engine until the end and collect events.
 
         Args:
@@ -30,18 +47,63 @@ class EngineApp:
             List of event dictionaries in the order they were processed.
         """
 
+        engine = self.engine
+        if not all(hasattr(engine, name) for name in _BATCH_METHODS):
+            return self._run_by_event(chooser)
+        # Bind everything the loop touches once; each step is then local lookups.
+        drain = engine.drain_until_choice
+        finished = engine.is_finished
+        event_type = engine.current_event_type
+        current_event = engine.current_event
+        step = engine.step
+        events: List[Dict[str, object]] = []
+        extend = events.extend
+        append = events.append
+        while True:
+            extend(drain())
+            if finished():
+                break
+            handler = _HANDLERS.get(event_type())
+            if handler is None:
+                # Only handled types need the event up front; step() returns the rest.
+                append(step())
+                continue
+            event = current_event()
+            append(event)
+            handler(engine, event, chooser)
+        return events
+
+    def _run_by_event(self, chooser: Optional[Chooser]) -> List[Dict[str, object]]:
+        engine = self.engine
         events: List[Dict[str, object]] = []
         while True:
             try:
-                event = self.engine.current_event()
+                event = engine.current_event()
             except ValueError as exc:
                 if "script exhausted" not in str(exc):
                     raise
                 break
             events.append(event)
-            if event.get("type") == "choice":
-                index = chooser(event) if chooser else 0
-                self.engine.choose(index)
+            handler = _HANDLERS.get(event.get("type"))
+            if handler is None:
+                engine.step()
             else:
-                self.engine.step()
+                handler(engine, event, chooser)
         return events
+
+    def run_scripted(self, choices: Iterable[int]) -> List[Dict[str, object]]:
+        """Replay the engine with a fixed sequence of choice indices.
+
+        Meant for deterministic batch runs (fuzzers, reachability checks) that
+        know their picks up front. Choices beyond the end of ``choices`` fall
+        back to option 0, matching `run()` without a chooser.
+
+        Args:
+            choices: Option index to select at each choice event, in order.
+
+        Returns:
+            List of event dictionaries in the order they were processed.
+        """
+
+        picks = iter(choices)
+        return self.run(lambda _event: next(picks, 0))
@@ -2,7 +2,20 @@
 
 from __future__ import annotations
 
-from typing import Dict, Iterable, List, Optional, Tuple, Union
+from bisect import insort
+from types import MappingProxyType
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    overload,
+)
 
 from .types import (
     AudioAction,
@@ -20,10 +33,13 @@ from .types import (
     Patch,
     Scene,
     SetCharacterPosition,
+    SCRIPT_SCHEMA_VERSION,
     Script,
     SetFlag,
     SetVar,
     Transition,
+    _intern_name,
+    _script_json,
     normalize_character_patches,
     normalize_characters,
     normalize_choice_options,
@@ -34,49 +50,117 @@ CharacterInput = Union[Tuple[str, Optional[str], Optional[str]], CharacterPlacem
 CharacterPatchInput = Union[Tuple[str, Optional[str], Optional[str]], CharacterPatch]
 
 
+class _ReadOnlyList(Sequence[Event]):
+    """Read-only view over a list that is still being built (no copy on access)."""
+
+    __slots__ = ("_items",)
+
+    def __init__(self, items: List[Event]) -> None:
+        self._items = items
+
+    @overload
+    def __getitem__(self, index: int) -> Event: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[Event]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Event, Sequence[Event]]:
+        return self._items[index]
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[Event]:
+        return iter(self._items)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._items!r})"
+
+    def __eq__(self, other: object) -> bool:
+        # Compare like the list this view stands in for.
+        if isinstance(other, _ReadOnlyList):
+            return self._items == other._items
+        if isinstance(other, list):
+            return self._items == other
+        return NotImplemented
+
+
 class ScriptBuilder:
     """Incrementally build a script with stable serialization.
 
     Labels are tracked in insertion order and serialized in sorted order to keep
-    JSON output stable across runs.
+    JSON output stable across runs. Names that repeat across events (speakers,
+    labels, targets, flag/var keys, character names) are interned on insertion.
     """
 
     def __init__(self) -> None:
         self._events: List[Event] = []
         self._labels: Dict[str, int] = {}
+        # Label names kept sorted as they are added, so serialization never sorts.
+        self._label_names: List[str] = []
+        # Serialization cache, dropped by every mutation.
+        self._snapshot: Optional[Script] = None
+        self._json: Optional[str] = None
+
+    def _invalidate(self) -> None:
+        self._snapshot = None
+        self._json = None
+
+    def _append(self, event: Event) -> None:
+        self._events.append(event)
+        self._invalidate()
 
     @property
-    def events(self) -> List[Event]:
-        """Current list of events (read-only snapshot)."""
+    def events(self) -> Sequence[Event]:
+        """Current events as a read-only view (copy it to keep a snapshot)."""
 
-        return list(self._events)
+        return _ReadOnlyList(self._events)
 
     @property
-    def labels(self) -> Dict[str, int]:
-        """Current label map (read-only snapshot)."""
+    def labels(self) -> Mapping[str, int]:
+        """Current label map as a read-only view (copy it to keep a snapshot)."""
 
-        return dict(self._labels)
+        return MappingProxyType(self._labels)
 
     def label(self, name: str) -> None:
         """Record a label at the current event index."""
 
-        self._labels[name] = len(self._events)
+        key = _intern_name(name)
+        if key not in self._labels:
+            insort(self._label_names, key)
+        self._labels[key] = len(self._events)
+        self._invalidate()
 
     def add_event(self, event: Event) -> None:
         """Append a pre-built event object."""
 
-        self._events.append(event)
+        self._append(event)
 
     def dialogue(self, speaker: str, text: str) -> None:
         """Append a dialogue event."""
 
-        self._events.append(Dialogue(speaker=speaker, text=text))
+        self._append(Dialogue(speaker=_intern_name(speaker), text=text))
+
+    def dialogues(self, lines: Iterable[Tuple[str, str]]) -> None:
+        """Append one dialogue event per ``(speaker, text)`` pair.
+
+        Equivalent to calling `dialogue()` in a loop, with less per-line
+        overhead for generated scripts.
+        """
+
+        # Build every event first so a malformed line leaves the builder untouched.
+        new_events = [
+            Dialogue(speaker=_intern_name(speaker), text=text)
+            for speaker, text in lines
+        ]
+        self._events.extend(new_events)
+        self._invalidate()
 
     def choice(self, prompt: str, options: Iterable[ChoiceOptionInput]) -> None:
         """Append a choice event."""
 
         normalized = normalize_choice_options(options)
-        self._events.append(Choice(prompt=prompt, options=normalized))
+        self._append(Choice(prompt=prompt, options=normalized))
 
     def scene(
         self,
@@ -87,37 +171,41 @@ class ScriptBuilder:
         """Append a scene update event."""
 
         normalized = normalize_characters(characters)
-        self._events.append(
-            Scene(background=background, music=music, characters=normalized)
-        )
+        self._append(Scene(background=background, music=music, characters=normalized))
 
     def jump(self, target: str) -> None:
         """Append a jump event."""
 
-        self._events.append(Jump(target=target))
+        self._append(Jump(target=_intern_name(target)))
 
     def set_flag(self, key: str, value: bool) -> None:
         """Append a set-flag event."""
 
-        self._events.append(SetFlag(key=key, value=value))
+        self._append(SetFlag(key=_intern_name(key), value=value))
 
     def set_var(self, key: str, value: int) -> None:
         """Append a set-var event."""
 
-        self._events.append(SetVar(key=key, value=value))
+        self._append(SetVar(key=_intern_name(key), value=value))
 
     def jump_if_flag(self, key: str, is_set: bool, target: str) -> None:
         """Append a conditional jump on a flag."""
 
-        self._events.append(
-            JumpIf(cond=CondFlag(key=key, is_set=is_set), target=target)
+        self._append(
+            JumpIf(
+                cond=CondFlag(key=_intern_name(key), is_set=is_set),
+                target=_intern_name(target),
+            )
         )
 
     def jump_if_var(self, key: str, op: str, value: int, target: str) -> None:
         """Append a conditional jump on a variable comparison."""
 
-        self._events.append(
-            JumpIf(cond=CondVarCmp(key=key, op=op, value=value), target=target)
+        self._append(
+            JumpIf(
+                cond=CondVarCmp(key=_intern_name(key), op=op, value=value),
+                target=_intern_name(target),
+            )
         )
 
     def patch(
@@ -132,13 +220,13 @@ class ScriptBuilder:
 
         normalized_add = normalize_characters(add)
         normalized_update = normalize_character_patches(update)
-        self._events.append(
+        self._append(
             Patch(
                 background=background,
                 music=music,
                 add=normalized_add,
                 update=normalized_update,
-                remove=list(remove),
+                remove=[_intern_name(name) for name in remove],
             )
         )
 
@@ -153,7 +241,7 @@ class ScriptBuilder:
     ) -> None:
         """Append an audio action event."""
 
-        self._events.append(
+        self._append(
             AudioAction(
                 channel=channel,
                 action=action,
@@ -169,14 +257,16 @@ class ScriptBuilder:
     ) -> None:
         """Append a transition event."""
 
-        self._events.append(Transition(kind=kind, duration_ms=duration_ms, color=color))
+        self._append(Transition(kind=kind, duration_ms=duration_ms, color=color))
 
     def set_character_position(
         self, name: str, x: int, y: int, scale: Optional[float] = None
     ) -> None:
         """Append an absolute character position event."""
 
-        self._events.append(SetCharacterPosition(name=name, x=x, y=y, scale=scale))
+        self._append(
+            SetCharacterPosition(name=_intern_name(name), x=x, y=y, scale=scale)
+        )
 
     def ext_call(self, command: str, args: Iterable[str] = ()) -> None:
         """Append an external call event."""
@@ -186,19 +276,37 @@ class ScriptBuilder:
             if not isinstance(arg, str):
                 raise ValueError(f"ext_call args must be str, got {type(arg).__name__}")
             normalized_args.append(arg)
-        self._events.append(ExtCall(command=command, args=normalized_args))
+        self._append(ExtCall(command=command, args=normalized_args))
 
     def build(self) -> Script:
         """Finalize and return a Script object."""
 
-        return Script(events=list(self._events), labels=dict(self._labels))
+        return Script(events=tuple(self._events), labels=self._sorted_labels())
 
     def to_dict(self) -> Dict[str, object]:
         """Serialize the script into a stable dict."""
 
-        return self.build().to_dict()
+        return self._built().to_dict()
 
     def to_json(self) -> str:
-        """Serialize the script into stable JSON."""
+        """Serialize the script into stable JSON.
+
+        The string is cached until the builder is modified again.
+        """
+
+        if self._json is None:
+            # Encode straight from the builder's own list: no Script copy needed.
+            self._json = _script_json(
+                self._events, self._sorted_labels(), SCRIPT_SCHEMA_VERSION
+            )
+        return self._json
+
+    def _sorted_labels(self) -> Dict[str, int]:
+        labels = self._labels
+        return {key: labels[key] for key in self._label_names}
 
-        return self.build().to_json()
+    def _built(self) -> Script:
+        # Private snapshot for serialization; build() keeps returning fresh copies.
+        if self._snapshot is None:
+            self._snapshot = self.build()
+        return self._snapshot
@@ -2,11 +2,10 @@
 
 from __future__ import annotations
 
-import json
-from typing import Any, Dict, Mapping, Optional, Union
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
 
 from .native import call_native_method, load_native_engine
-from .types import Script
+from .types import Script, _canonical_json
 
 
 class Engine:
@@ -17,8 +16,7 @@ class Engine:
     """
 
     def __init__(self, script_json: str) -> None:
-        self._engine = load_native_engine()(script_json)
-        self._last_audio: Any = []
+        self._bind_native(load_native_engine()(script_json))
 
     @classmethod
     def from_script(cls, script: Union[Script, Mapping[str, Any], str]) -> "Engine":
@@ -28,29 +26,139 @@ class Engine:
             return cls(script.to_json())
         if isinstance(script, str):
             return cls(script)
-        return cls(json.dumps(script, separators=(",", ":"), sort_keys=True))
+        from_dict = getattr(load_native_engine(), "from_dict", None)
+        if from_dict is not None and type(script) is dict:
+            return cls._from_native(from_dict(script))
+        return cls(_canonical_json(script))
+
+    @classmethod
+    def from_compiled(cls, data: bytes) -> "Engine":
+        """Create an engine from a blob returned by `compiled_bytes()`.
+
+        Skips JSON parsing and script compilation, which makes it the cheapest
+        way to spin up many engines for the same script.
+        """
+
+        native_engine = call_native_method(
+            load_native_engine(), "from_compiled_bytes", "compiled script loading", data
+        )
+        return cls._from_native(native_engine)
+
+    @classmethod
+    def _from_native(cls, native_engine: Any) -> "Engine":
+        engine = cls.__new__(cls)
+        engine._bind_native(native_engine)
+        return engine
+
+    def _bind_native(self, native_engine: Any) -> None:
+        """Resolve the per-step native methods once instead of on every call.
+
+        A missing method is stored as None; the wrapper then goes through
+        `call_native_method`, which raises the usual traceable RuntimeError.
+        """
+
+        self._engine = native_engine
+        self._last_audio: Any = []
+        self._native_current_event = getattr(native_engine, "current_event", None)
+        self._native_choose = getattr(native_engine, "choose", None)
+        self._native_visual_state = getattr(native_engine, "visual_state", None)
+        self._native_ui_state = getattr(native_engine, "ui_state", None)
+        self._native_step = getattr(native_engine, "step", None)
+        tag = getattr(native_engine, "current_event_tag", None)
+        event_types = getattr(native_engine, "supported_event_types", None)
+        if tag is not None and event_types is not None:
+            # Tags index the native type list, so read it instead of mirroring it.
+            self._event_types: Tuple[str, ...] = tuple(event_types())
+        else:
+            tag = None
+        self._native_event_tag = tag
+        self._native_is_finished = getattr(native_engine, "is_finished", None)
+
+    def compiled_bytes(self) -> bytes:
+        """Return the loaded script in the native compiled binary format."""
+
+        return call_native_method(
+            self._engine, "compiled_bytes", "compiled script export"
+        )
 
     def current_event(self) -> Dict[str, Any]:
         """Return the current event as a Python dict."""
 
-        return call_native_method(self._engine, "current_event", "current event access")
+        method = self._native_current_event
+        if method is None:
+            return call_native_method(
+                self._engine, "current_event", "current event access"
+            )
+        return method()
+
+    def current_event_type(self) -> str:
+        """Return the type of the current event without building its dict."""
+
+        method = self._native_event_tag
+        if method is not None:
+            return self._event_types[method()]
+        return self.current_event()["type"]
 
     def step(self) -> Dict[str, Any]:
         """Advance the engine and return the event that was processed."""
 
-        result = call_native_method(self._engine, "step", "step execution")
+        method = self._native_step
+        if method is None:
+            result = call_native_method(self._engine, "step", "step execution")
+        else:
+            result = method()
         if hasattr(result, "event"):
             self._last_audio = getattr(result, "audio", [])
             return result.event
         self._last_audio = []
         return result
 
+    def drain_until_choice(self) -> List[Dict[str, Any]]:
+        """Step until a choice, an ext-call, or the end of the script.
+
+        Returns the processed events in order. A pending choice is left as the
+        current event; an ext-call is processed once and ends the batch. Uses
+        the native batch API when available so the whole run crosses the binding
+        boundary in a single call.
+        """
+
+        method = getattr(self._engine, "drain_until_choice", None)
+        if method is not None:
+            events = method()
+            audio = getattr(self._engine, "get_last_audio_commands", None)
+            self._last_audio = audio() if audio is not None else []
+            return events
+
+        # Fallback for native modules without the batch API.
+        events: List[Dict[str, Any]] = []
+        while not self.is_finished():
+            event_type = self.current_event_type()
+            if event_type == "choice":
+                break
+            events.append(self.step())
+            if event_type == "ext_call":
+                break
+        return events
+
     def choose(self, option_index: int) -> Dict[str, Any]:
         """Apply a choice selection and return the choice event."""
 
-        return call_native_method(
-            self._engine, "choose", "choice handling", option_index
-        )
+        method = self._native_choose
+        if method is None:
+            return call_native_method(
+                self._engine, "choose", "choice handling", option_index
+            )
+        return method(option_index)
+
+    def reset(self, to_label: Optional[str] = None) -> None:
+        """Restart the script without re-parsing it.
+
+        Args:
+            to_label: Optional label to jump to after resetting to the start.
+        """
+
+        call_native_method(self._engine, "reset", "engine reset", to_label)
+        self._last_audio = []
 
     def register_handler(self, callback: Any) -> None:
         """Register a native ext-call callback, if exposed by the binding."""
@@ -91,14 +199,39 @@ class Engine:
         )
 
     def visual_state(self) -> Dict[str, Any]:
-        """Return the current visual state as a Python dict."""
+        """Return the current visual state as a Python dict.
+
+        Each call returns a new dict that the caller may modify.
+        """
 
-        return call_native_method(self._engine, "visual_state", "visual state access")
+        method = self._native_visual_state
+        if method is None:
+            return call_native_method(
+                self._engine, "visual_state", "visual state access"
+            )
+        return method()
 
     def ui_state(self) -> Dict[str, Any]:
         """Return the current UI state as a Python dict."""
 
-        return call_native_method(self._engine, "ui_state", "ui_state access")
+        method = self._native_ui_state
+        if method is None:
+            return call_native_method(self._engine, "ui_state", "ui_state access")
+        return method()
+
+    def is_finished(self) -> bool:
+        """Return whether the script has been fully processed."""
+
+        method = self._native_is_finished
+        if method is not None:
+            return bool(method())
+        try:
+            self.current_event()
+        except ValueError as exc:
+            if "script exhausted" not in str(exc):
+                raise
+            return True
+        return False
 
     def is_current_dialogue_read(self) -> bool:
         """Return whether the current dialogue event was already shown in this session."""
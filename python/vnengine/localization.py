@@ -3,29 +3,44 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, Iterable, List, Set, Tuple
+from typing import Dict, Iterable, Iterator, List, Set, Tuple
 
 from .types import Script
 
+_LOC_PREFIX = "loc:"
+
 
 def _extract_loc_key(value: str) -> str | None:
     text = value.strip()
-    if not text.startswith("loc:"):
+    if not text.startswith(_LOC_PREFIX):
         return None
-    key = text[4:].strip()
+    key = text[len(_LOC_PREFIX) :].strip()
     return key or None
 
 
+def _localizable_texts(script: Script) -> Iterator[str]:
+    # Only dialogue and choice text can carry keys; the script indexes both.
+    for dialogue in script.iter_dialogues():
+        yield dialogue.speaker
+        yield dialogue.text
+    for choice in script.iter_choices():
+        yield choice.prompt
+        for option in choice.options:
+            yield option.text
+
+
 @dataclass(frozen=True)
 class LocalizationCatalog:
     default_locale: str = "en"
     locales: Dict[str, Dict[str, str]] = field(default_factory=dict)
 
     def resolve(self, locale: str, key: str) -> str | None:
-        if locale in self.locales and key in self.locales[locale]:
-            return self.locales[locale][key]
-        default_table = self.locales.get(self.default_locale, {})
-        return default_table.get(key)
+        locales = self.locales
+        table = locales.get(locale)
+        if table is not None and key in table:
+            return table[key]
+        default_table = locales.get(self.default_locale)
+        return default_table.get(key) if default_table is not None else None
 
     def resolve_or_key(self, locale: str, key: str) -> str:
         return self.resolve(locale, key) or key
@@ -49,21 +64,8 @@ class LocalizationCatalog:
 
 def collect_script_localization_keys(script: Script) -> Set[str]:
     keys: Set[str] = set()
-    for event in script.events:
-        payload = event.to_dict()
-        event_type = payload.get("type")
-        if event_type == "dialogue":
-            for field_name in ("speaker", "text"):
-                value = str(payload.get(field_name, ""))
-                key = _extract_loc_key(value)
-                if key:
-                    keys.add(key)
-        elif event_type == "choice":
-            prompt_key = _extract_loc_key(str(payload.get("prompt", "")))
-            if prompt_key:
-                keys.add(prompt_key)
-            for option in payload.get("options", []):
-                option_key = _extract_loc_key(str(option.get("text", "")))
-                if option_key:
-                    keys.add(option_key)
+    for value in _localizable_texts(script):
+        key = _extract_loc_key(value)
+        if key:
+            keys.add(key)
     return keys
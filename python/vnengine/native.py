@@ -2,12 +2,22 @@
 
 from __future__ import annotations
 
-from typing import Any
+import sys
+from typing import Any, Optional, Tuple
+
+# (module, engine class) from the last successful lookup. Keyed on the module
+# object so swapping ``sys.modules["visual_novel_engine"]`` forces a re-probe.
+_NATIVE_CACHE: Optional[Tuple[Any, Any]] = None
 
 
 def load_native_engine() -> Any:
     """Return the native engine class, with a traceable error if unavailable."""
 
+    global _NATIVE_CACHE
+    cached = _NATIVE_CACHE
+    if cached is not None and sys.modules.get("visual_novel_engine") is cached[0]:
+        return cached[1]
+
     try:
         import visual_novel_engine as native
     except ImportError as exc:  # pragma: no cover - environment dependent
@@ -18,13 +28,12 @@ def load_native_engine() -> Any:
         ) from exc
 
     engine_cls = getattr(native, "Engine", None)
+    if engine_cls is None:
+        engine_cls = getattr(native, "PyEngine", None)
     if engine_cls is not None:
+        _NATIVE_CACHE = (native, engine_cls)
         return engine_cls
 
-    py_engine = getattr(native, "PyEngine", None)
-    if py_engine is not None:
-        return py_engine
-
     raise RuntimeError(
         f"Native module 'visual_novel_engine' was imported from "
         f"{getattr(native, '__file__', 'unknown location')!r}, but it does not "
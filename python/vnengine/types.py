@@ -4,10 +4,71 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 import json
-from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+from json.encoder import encode_basestring_ascii
+from operator import gt
+import sys
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 SCRIPT_SCHEMA_VERSION = "1.0"
 
+# Events are created once per script line, so drop the per-instance __dict__
+# where dataclasses support it (``slots=True`` requires Python 3.10+).
+_FROZEN: Dict[str, Any] = {"frozen": True}
+if sys.version_info >= (3, 10):
+    _FROZEN["slots"] = True
+
+# Canonical script JSON (compact, sorted keys, ASCII escapes). One shared encoder
+# avoids rebuilding a JSONEncoder on every ``to_json`` call; output is identical
+# to ``json.dumps(..., separators=(",", ":"), sort_keys=True)``.
+_canonical_json = json.JSONEncoder(separators=(",", ":"), sort_keys=True).encode
+
+# Parsing has no byte-identity contract, so use orjson for it when it is
+# installed. orjson is stricter than json (it rejects NaN/Infinity and integers
+# beyond 64 bits), so documents it refuses are parsed again with json: both
+# paths accept the same input and produce the same values.
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    _json_loads: Callable[[Union[str, bytes]], Any] = json.loads
+else:
+
+    def _json_loads(raw: Union[str, bytes]) -> Any:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            return json.loads(raw)
+
+
+def _intern_name(value: str) -> str:
+    """Intern identifier-like strings (speakers, labels, keys) that repeat a lot."""
+
+    return sys.intern(value) if type(value) is str else value
+
+
+def _freeze_fields(node: Any, *names: str) -> None:
+    """Store sequence fields of a frozen node as tuples.
+
+    Keeps cached JSON results valid and lets every empty
+    default share the ``()`` singleton instead of a fresh list per instance.
+    """
+
+    for name in names:
+        value = getattr(node, name)
+        if type(value) is not tuple:
+            object.__setattr__(node, name, tuple(value))
+
 
 def _require_bool(value: Any, field_name: str) -> bool:
     if not isinstance(value, bool):
@@ -16,19 +77,43 @@ def _require_bool(value: Any, field_name: str) -> bool:
 
 
 def _require_int(value: Any, field_name: str) -> int:
+    if type(value) is int:
+        return value
     if isinstance(value, bool) or not isinstance(value, int):
         raise ValueError(f"{field_name} must be int, got {type(value).__name__}")
     return value
 
 
 def _require_float(value: Any, field_name: str) -> float:
+    if type(value) is float:
+        return value
     if isinstance(value, bool) or not isinstance(value, (int, float)):
         raise ValueError(f"{field_name} must be float, got {type(value).__name__}")
     return float(value)
 
 
-@dataclass(frozen=True)
-class Dialogue:
+class _JsonCached:
+    """Base for frozen script nodes whose canonical JSON is computed once.
+
+    The cache is a slot rather than a dataclass field, so it stays out of
+    ``fields()``, ``asdict()``, ``repr()`` and comparisons.
+    """
+
+    __slots__ = ("_json_cache",)
+
+    def _json_fragment(self) -> str:
+        """Canonical JSON for this node alone, computed once."""
+
+        try:
+            return self._json_cache
+        except AttributeError:
+            cached = _canonical_json(self.to_dict())  # type: ignore[attr-defined]
+            object.__setattr__(self, "_json_cache", cached)
+            return cached
+
+
+@dataclass(**_FROZEN)
+class Dialogue(_JsonCached):
     """Dialogue event.
 
     Args:
@@ -42,13 +127,26 @@ class Dialogue:
     def to_dict(self) -> Dict[str, Any]:
         return {"type": "dialogue", "speaker": self.speaker, "text": self.text}
 
+    def _json_fragment(self) -> str:
+        # Dialogue dominates most scripts, so emit its fixed shape directly
+        # instead of building the dict and walking it with the generic encoder.
+        try:
+            return self._json_cache
+        except AttributeError:
+            cached = (
+                f'{{"speaker":{encode_basestring_ascii(self.speaker)},'
+                f'"text":{encode_basestring_ascii(self.text)},"type":"dialogue"}}'
+            )
+            object.__setattr__(self, "_json_cache", cached)
+            return cached
+
     @classmethod
     def from_dict(cls, data: Mapping[str, Any]) -> "Dialogue":
-        return cls(speaker=str(data["speaker"]), text=str(data["text"]))
+        return cls(speaker=_intern_name(str(data["speaker"])), text=str(data["text"]))
 
 
-@dataclass(frozen=True)
-class ChoiceOption:
+@dataclass(**_FROZEN)
+class ChoiceOption(_JsonCached):
     """Choice option entry."""
 
     text: str
@@ -59,15 +157,18 @@ class ChoiceOption:
 
     @classmethod
     def from_dict(cls, data: Mapping[str, Any]) -> "ChoiceOption":
-        return cls(text=str(data["text"]), target=str(data["target"]))
+        return cls(text=str(data["text"]), target=_intern_name(str(data["target"])))
 
 
-@dataclass(frozen=True)
-class Choice:
+@dataclass(**_FROZEN)
+class Choice(_JsonCached):
     """Choice event containing a prompt and options."""
 
     prompt: str
-    options: List[ChoiceOption] = field(default_factory=list)
+    options: Sequence[ChoiceOption] = ()
+
+    def __post_init__(self) -> None:
+        _freeze_fields(self, "options")
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -78,12 +179,12 @@ class Choice:
 
     @classmethod
     def from_dict(cls, data: Mapping[str, Any]) -> "Choice":
-        options = [ChoiceOption.from_dict(item) for item in data.get("options", [])]
+        options = tuple(map(ChoiceOption.from_dict, data.get("options", ())))
         return cls(prompt=str(data["prompt"]), options=options)
 
 
-@dataclass(frozen=True)
-class CharacterPlacement:
+@dataclass(**_FROZEN)
+class CharacterPlacement(_JsonCached):
     """Character placement in a scene update."""
 
     name: str
@@ -108,7 +209,7 @@ class CharacterPlacement:
         expression = data.get("expression")
         position = data.get("position")
         return cls(
-            name=str(data["name"]),
+            name=_intern_name(str(data["name"])),
             expression=str(expression) if expression is not None else None,
             position=str(position) if position is not None else None,
             x=_require_int(data["x"], "CharacterPlacement 'x'")
@@ -123,13 +224,16 @@ class CharacterPlacement:
         )
 
 
-@dataclass(frozen=True)
-class Scene:
+@dataclass(**_FROZEN)
+class Scene(_JsonCached):
     """Scene update event."""
 
     background: Optional[str] = None
     music: Optional[str] = None
-    characters: List[CharacterPlacement] = field(default_factory=list)
+    characters: Sequence[CharacterPlacement] = ()
+
+    def __post_init__(self) -> None:
+        _freeze_fields(self, "characters")
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -141,9 +245,9 @@ class Scene:
 
     @classmethod
     def from_dict(cls, data: Mapping[str, Any]) -> "Scene":
-        characters = [
-            CharacterPlacement.from_dict(item) for item in data.get("characters", [])
-        ]
+        characters = tuple(
+            map(CharacterPlacement.from_dict, data.get("characters", ()))
+        )
         return cls(
             background=data.get("background"),
             music=data.get("music"),
@@ -151,8 +255,8 @@ class Scene:
         )
 
 
-@dataclass(frozen=True)
-class CharacterPatch:
+@dataclass(**_FROZEN)
+class CharacterPatch(_JsonCached):
     """Character patch entry."""
 
     name: str
@@ -171,21 +275,24 @@ class CharacterPatch:
         expression = data.get("expression")
         position = data.get("position")
         return cls(
-            name=str(data["name"]),
+            name=_intern_name(str(data["name"])),
             expression=str(expression) if expression is not None else None,
             position=str(position) if position is not None else None,
         )
 
 
-@dataclass(frozen=True)
-class Patch:
+@dataclass(**_FROZEN)
+class Patch(_JsonCached):
     """Scene patch event with add/update/remove operations."""
 
     background: Optional[str] = None
     music: Optional[str] = None
-    add: List[CharacterPlacement] = field(default_factory=list)
-    update: List[CharacterPatch] = field(default_factory=list)
-    remove: List[str] = field(default_factory=list)
+    add: Sequence[CharacterPlacement] = ()
+    update: Sequence[CharacterPatch] = ()
+    remove: Sequence[str] = ()
+
+    def __post_init__(self) -> None:
+        _freeze_fields(self, "add", "update", "remove")
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -199,9 +306,9 @@ class Patch:
 
     @classmethod
     def from_dict(cls, data: Mapping[str, Any]) -> "Patch":
-        add = [CharacterPlacement.from_dict(item) for item in data.get("add", [])]
-        update = [CharacterPatch.from_dict(item) for item in data.get("update", [])]
-        remove = [str(item) for item in data.get("remove", [])]
+        add = tuple(map(CharacterPlacement.from_dict, data.get("add", ())))
+        update = tuple(map(CharacterPatch.from_dict, data.get("update", ())))
+        remove = tuple(map(str, data.get("remove", ())))
         return cls(
             background=data.get("background"),
             music=data.get("music"),
@@ -211,8 +318,8 @@ class Patch:
         )
 
 
-@dataclass(frozen=True)
-class AudioAction:
+@dataclass(**_FROZEN)
+class AudioAction(_JsonCached):
     """Audio action event."""
 
     channel: str
@@ -255,8 +362,8 @@ class AudioAction:
         )
 
 
-@dataclass(frozen=True)
-class Transition:
+@dataclass(**_FROZEN)
+class Transition(_JsonCached):
     """Scene transition event."""
 
     kind: str
@@ -280,8 +387,8 @@ class Transition:
         )
 
 
-@dataclass(frozen=True)
-class SetCharacterPosition:
+@dataclass(**_FROZEN)
+class SetCharacterPosition(_JsonCached):
     """Absolute character position event."""
 
     name: str
@@ -301,7 +408,7 @@ class SetCharacterPosition:
     @classmethod
     def from_dict(cls, data: Mapping[str, Any]) -> "SetCharacterPosition":
         return cls(
-            name=str(data["name"]),
+            name=_intern_name(str(data["name"])),
             x=_require_int(data["x"], "SetCharacterPosition 'x'"),
             y=_require_int(data["y"], "SetCharacterPosition 'y'"),
             scale=_require_float(data["scale"], "SetCharacterPosition 'scale'")
@@ -310,12 +417,15 @@ class SetCharacterPosition:
         )
 
 
-@dataclass(frozen=True)
-class ExtCall:
+@dataclass(**_FROZEN)
+class ExtCall(_JsonCached):
     """External call event."""
 
     command: str
-    args: List[str] = field(default_factory=list)
+    args: Sequence[str] = ()
+
+    def __post_init__(self) -> None:
+        _freeze_fields(self, "args")
 
     def to_dict(self) -> Dict[str, Any]:
         return {"type": "ext_call", "command": self.command, "args": list(self.args)}
@@ -324,12 +434,12 @@ class ExtCall:
     def from_dict(cls, data: Mapping[str, Any]) -> "ExtCall":
         return cls(
             command=str(data["command"]),
-            args=[str(item) for item in data.get("args", [])],
+            args=tuple(map(str, data.get("args", ()))),
         )
 
 
-@dataclass(frozen=True)
-class Jump:
+@dataclass(**_FROZEN)
+class Jump(_JsonCached):
     """Jump event."""
 
     target: str
@@ -339,11 +449,11 @@ class Jump:
 
     @classmethod
     def from_dict(cls, data: Mapping[str, Any]) -> "Jump":
-        return cls(target=str(data["target"]))
+        return cls(target=_intern_name(str(data["target"])))
 
 
-@dataclass(frozen=True)
-class SetFlag:
+@dataclass(**_FROZEN)
+class SetFlag(_JsonCached):
     """Set-flag event."""
 
     key: str
@@ -354,16 +464,14 @@ class SetFlag:
 
     @classmethod
     def from_dict(cls, data: Mapping[str, Any]) -> "SetFlag":
-        value = data["value"]
-        if not isinstance(value, bool):
-            raise ValueError(
-                f"SetFlag 'value' must be bool, got {type(value).__name__}"
-            )
-        return cls(key=str(data["key"]), value=value)
+        return cls(
+            key=_intern_name(str(data["key"])),
+            value=_require_bool(data["value"], "SetFlag 'value'"),
+        )
 
 
-@dataclass(frozen=True)
-class SetVar:
+@dataclass(**_FROZEN)
+class SetVar(_JsonCached):
     """Set-var event."""
 
     key: str
@@ -375,11 +483,14 @@ class SetVar:
     @classmethod
     def from_dict(cls, data: Mapping[str, Any]) -> "SetVar":
         value = data["value"]
-        return cls(key=str(data["key"]), value=_require_int(value, "SetVar 'value'"))
+        return cls(
+            key=_intern_name(str(data["key"])),
+            value=_require_int(value, "SetVar 'value'"),
+        )
 
 
-@dataclass(frozen=True)
-class CondFlag:
+@dataclass(**_FROZEN)
+class CondFlag(_JsonCached):
     key: str
     is_set: bool
 
@@ -388,16 +499,14 @@ class CondFlag:
 
     @classmethod
     def from_dict(cls, data: Mapping[str, Any]) -> "CondFlag":
-        value = data["is_set"]
-        if not isinstance(value, bool):
-            raise ValueError(
-                f"CondFlag 'is_set' must be bool, got {type(value).__name__}"
-            )
-        return cls(key=str(data["key"]), is_set=value)
+        return cls(
+            key=_intern_name(str(data["key"])),
+            is_set=_require_bool(data["is_set"], "CondFlag 'is_set'"),
+        )
 
 
-@dataclass(frozen=True)
-class CondVarCmp:
+@dataclass(**_FROZEN)
+class CondVarCmp(_JsonCached):
     key: str
     op: str
     value: int
@@ -409,7 +518,7 @@ class CondVarCmp:
     def from_dict(cls, data: Mapping[str, Any]) -> "CondVarCmp":
         value = data["value"]
         return cls(
-            key=str(data["key"]),
+            key=_intern_name(str(data["key"])),
             op=str(data["op"]),
             value=_require_int(value, "CondVarCmp 'value'"),
         )
@@ -418,8 +527,8 @@ class CondVarCmp:
 Cond = Union[CondFlag, CondVarCmp]
 
 
-@dataclass(frozen=True)
-class JumpIf:
+@dataclass(**_FROZEN)
+class JumpIf(_JsonCached):
     """Conditional jump event."""
 
     cond: Cond
@@ -431,7 +540,7 @@ class JumpIf:
     @classmethod
     def from_dict(cls, data: Mapping[str, Any]) -> "JumpIf":
         cond = cond_from_dict(data.get("cond", {}))
-        return cls(cond=cond, target=str(data["target"]))
+        return cls(cond=cond, target=_intern_name(str(data["target"])))
 
 
 Event = Union[
@@ -450,30 +559,77 @@ Event = Union[
 ]
 
 
-@dataclass(frozen=True)
-class Script:
+class _ScriptCaches:
+    """Slots for the values `Script` derives lazily, kept out of its fields."""
+
+    __slots__ = ("_json_cache", "_events_by_type")
+
+
+@dataclass(**_FROZEN)
+class Script(_ScriptCaches):
     """Script container with stable JSON serialization.
 
+    ``events`` is stored as a tuple, which keeps the cached ``to_json()``
+    result valid for the lifetime of the instance.
+
     Args:
         events: Ordered list of events.
         labels: Mapping from label name to event index.
     """
 
-    events: List[Event] = field(default_factory=list)
+    events: Sequence[Event] = ()
     labels: Dict[str, int] = field(default_factory=dict)
 
     script_schema_version: str = SCRIPT_SCHEMA_VERSION
 
+    def __post_init__(self) -> None:
+        _freeze_fields(self, "events")
+        # Sort once here so repeated to_dict()/to_json() calls don't re-sort.
+        labels = self.labels
+        names = list(labels)
+        if any(map(gt, names, names[1:])):
+            ordered_labels = {key: labels[key] for key in sorted(names)}
+        else:
+            # Already ordered (ScriptBuilder.build, canonical JSON): just copy.
+            ordered_labels = dict(labels)
+        object.__setattr__(self, "labels", ordered_labels)
+
     def to_dict(self) -> Dict[str, Any]:
-        ordered_labels = {key: self.labels[key] for key in sorted(self.labels)}
         return {
             "script_schema_version": self.script_schema_version,
             "events": [event.to_dict() for event in self.events],
-            "labels": ordered_labels,
+            "labels": dict(self.labels),
         }
 
     def to_json(self) -> str:
-        return json.dumps(self.to_dict(), separators=(",", ":"), sort_keys=True)
+        try:
+            return self._json_cache
+        except AttributeError:
+            cached = _script_json(self.events, self.labels, self.script_schema_version)
+            object.__setattr__(self, "_json_cache", cached)
+            return cached
+
+    def iter_dialogues(self) -> Iterator[Dialogue]:
+        """Iterate over the dialogue events in script order."""
+
+        return iter(self._events_of_type(Dialogue))
+
+    def iter_choices(self) -> Iterator[Choice]:
+        """Iterate over the choice events in script order."""
+
+        return iter(self._events_of_type(Choice))
+
+    def _events_of_type(self, event_type: type) -> Tuple[Any, ...]:
+        try:
+            index: Dict[type, Tuple[Event, ...]] = self._events_by_type
+        except AttributeError:
+            # Built on first use; events are immutable, so it never goes stale.
+            grouped: Dict[type, List[Event]] = {}
+            for event in self.events:
+                grouped.setdefault(type(event), []).append(event)
+            index = {kind: tuple(events) for kind, events in grouped.items()}
+            object.__setattr__(self, "_events_by_type", index)
+        return index.get(event_type, ())
 
     @classmethod
     def from_dict(cls, data: Mapping[str, Any]) -> "Script":
@@ -486,9 +642,10 @@ class Script:
                 "schema incompatible: found "
                 f"{found_version}, expected {SCRIPT_SCHEMA_VERSION}"
             )
-        events = [event_from_dict(item) for item in data.get("events", [])]
+        # Build the tuple Script stores, so __post_init__ has nothing to copy.
+        events = tuple(map(event_from_dict, data.get("events", ())))
         labels = {
-            str(key): _require_int(value, f"Script label '{key}'")
+            _intern_name(str(key)): _require_int(value, f"Script label '{key}'")
             for key, value in data.get("labels", {}).items()
         }
         return cls(
@@ -497,58 +654,76 @@ class Script:
 
     @classmethod
     def from_json(cls, raw: str) -> "Script":
-        return cls.from_dict(json.loads(raw))
+        return cls.from_dict(_json_loads(raw))
+
+
+def _script_json(
+    events: Iterable[Event], labels: Mapping[str, int], schema_version: str
+) -> str:
+    """Canonical script JSON assembled from per-event cached fragments.
+
+    Produces the same bytes as encoding `Script.to_dict()`; ``labels`` must
+    already be in sorted order.
+    """
+
+    encoded_events = ",".join(
+        (
+            event._json_fragment()
+            if isinstance(event, _JsonCached)
+            else _canonical_json(event.to_dict())
+        )
+        for event in events
+    )
+    return (
+        f'{{"events":[{encoded_events}],"labels":{_canonical_json(labels)},'
+        f'"script_schema_version":{_canonical_json(schema_version)}}}'
+    )
+
+
+_EVENT_PARSERS: Dict[str, Callable[[Mapping[str, Any]], Event]] = {
+    "dialogue": Dialogue.from_dict,
+    "choice": Choice.from_dict,
+    "scene": Scene.from_dict,
+    "jump": Jump.from_dict,
+    "set_flag": SetFlag.from_dict,
+    "set_var": SetVar.from_dict,
+    "jump_if": JumpIf.from_dict,
+    "patch": Patch.from_dict,
+    "audio_action": AudioAction.from_dict,
+    "transition": Transition.from_dict,
+    "set_character_position": SetCharacterPosition.from_dict,
+    "ext_call": ExtCall.from_dict,
+}
+
+_COND_PARSERS: Dict[str, Callable[[Mapping[str, Any]], Cond]] = {
+    "flag": CondFlag.from_dict,
+    "var_cmp": CondVarCmp.from_dict,
+}
 
 
 def event_from_dict(data: Mapping[str, Any]) -> Event:
     event_type = data.get("type")
-    if event_type == "dialogue":
-        return Dialogue.from_dict(data)
-    if event_type == "choice":
-        return Choice.from_dict(data)
-    if event_type == "scene":
-        return Scene.from_dict(data)
-    if event_type == "jump":
-        return Jump.from_dict(data)
-    if event_type == "set_flag":
-        return SetFlag.from_dict(data)
-    if event_type == "set_var":
-        return SetVar.from_dict(data)
-    if event_type == "jump_if":
-        return JumpIf.from_dict(data)
-    if event_type == "patch":
-        return Patch.from_dict(data)
-    if event_type == "audio_action":
-        return AudioAction.from_dict(data)
-    if event_type == "transition":
-        return Transition.from_dict(data)
-    if event_type == "set_character_position":
-        return SetCharacterPosition.from_dict(data)
-    if event_type == "ext_call":
-        return ExtCall.from_dict(data)
-    raise ValueError(f"Unknown event type: {event_type}")
+    parser = _EVENT_PARSERS.get(event_type) if isinstance(event_type, str) else None
+    if parser is None:
+        raise ValueError(f"Unknown event type: {event_type}")
+    return parser(data)
 
 
 def cond_from_dict(data: Mapping[str, Any]) -> Cond:
     kind = data.get("kind")
-    if kind == "flag":
-        return CondFlag.from_dict(data)
-    if kind == "var_cmp":
-        return CondVarCmp.from_dict(data)
-    raise ValueError(f"Unknown condition kind: {kind}")
+    parser = _COND_PARSERS.get(kind) if isinstance(kind, str) else None
+    if parser is None:
+        raise ValueError(f"Unknown condition kind: {kind}")
+    return parser(data)
 
 
 def normalize_choice_options(
     options: Iterable[Union[ChoiceOption, Tuple[str, str]]],
 ) -> List[ChoiceOption]:
-    normalized: List[ChoiceOption] = []
-    for option in options:
-        if isinstance(option, ChoiceOption):
-            normalized.append(option)
-        else:
-            text, target = option
-            normalized.append(ChoiceOption(text=text, target=target))
-    return normalized
+    return [
+        option if isinstance(option, ChoiceOption) else _option_from_tuple(option)
+        for option in options
+    ]
 
 
 def normalize_characters(
@@ -556,16 +731,14 @@ def normalize_characters(
         Union[CharacterPlacement, Tuple[str, Optional[str], Optional[str]]]
     ],
 ) -> List[CharacterPlacement]:
-    normalized: List[CharacterPlacement] = []
-    for character in characters:
-        if isinstance(character, CharacterPlacement):
-            normalized.append(character)
-        else:
-            name, expression, position = character
-            normalized.append(
-                CharacterPlacement(name=name, expression=expression, position=position)
-            )
-    return normalized
+    return [
+        (
+            character
+            if isinstance(character, CharacterPlacement)
+            else _placement_from_tuple(character)
+        )
+        for character in characters
+    ]
 
 
 def normalize_character_patches(
@@ -573,16 +746,37 @@ def normalize_character_patches(
         Union[CharacterPatch, Tuple[str, Optional[str], Optional[str]]]
     ],
 ) -> List[CharacterPatch]:
-    normalized: List[CharacterPatch] = []
-    for character in characters:
-        if isinstance(character, CharacterPatch):
-            normalized.append(character)
-        else:
-            name, expression, position = character
-            normalized.append(
-                CharacterPatch(name=name, expression=expression, position=position)
-            )
-    return normalized
+    return [
+        (
+            character
+            if isinstance(character, CharacterPatch)
+            else _patch_from_tuple(character)
+        )
+        for character in characters
+    ]
+
+
+def _option_from_tuple(option: Tuple[str, str]) -> ChoiceOption:
+    text, target = option
+    return ChoiceOption(text=text, target=_intern_name(target))
+
+
+def _placement_from_tuple(
+    character: Tuple[str, Optional[str], Optional[str]],
+) -> CharacterPlacement:
+    name, expression, position = character
+    return CharacterPlacement(
+        name=_intern_name(name), expression=expression, position=position
+    )
+
+
+def _patch_from_tuple(
+    character: Tuple[str, Optional[str], Optional[str]],
+) -> CharacterPatch:
+    name, expression, position = character
+    return CharacterPatch(
+        name=_intern_name(name), expression=expression, position=position
+    )
 
 
 def _is_compatible_schema_version(found: str, expected: str) -> bool:
@@ -1,4 +1,6 @@
+from dataclasses import asdict, fields
 import json
+import math
 import os
 import subprocess
 import sys
@@ -16,14 +18,18 @@ from vnengine.localization import LocalizationCatalog, collect_script_localizati
 from vnengine.types import (
     AudioAction,
     CharacterPlacement,
+    Choice,
+    ChoiceOption,
     Dialogue,
     JumpIf,
+    Scene,
     Script,
     SCRIPT_SCHEMA_VERSION,
     SetCharacterPosition,
     SetFlag,
     SetVar,
     Transition,
+    _canonical_json,
     event_from_dict,
 )
 
@@ -40,6 +46,105 @@ class TypesTests(unittest.TestCase):
         )
         self.assertEqual(script.to_json(), expected)
 
+    def test_script_json_keeps_ascii_escapes_and_float_format(self):
+        script = Script(events=[Dialogue(speaker="Ava", text="¿Qué?")], labels={})
+        self.assertIn("\\u00bf", script.to_json())
+        self.assertEqual(Script.from_json(script.to_json()), script)
+        data = {"value": 1e16, "small": 0.00001, "text": "¿"}
+        self.assertEqual(
+            _canonical_json(data),
+            json.dumps(data, separators=(",", ":"), sort_keys=True),
+        )
+
+    def test_script_from_json_accepts_what_stdlib_json_accepts(self):
+        raw = (
+            '{"events":[{"type":"audio_action","channel":"bgm","action":"play",'
+            '"volume":NaN}],"labels":{"start":%d}}' % 2**70
+        )
+        expected = Script.from_dict(json.loads(raw))
+        # Without orjson installed this exercises the stdlib path directly.
+        self.assertEqual(Script.from_json(raw).labels, expected.labels)
+        self.assertTrue(math.isnan(Script.from_json(raw).events[0].volume))
+        with self.assertRaises(ValueError):
+            Script.from_json('{"events": [}')
+
+    def test_script_from_json_without_orjson(self):
+        code = """
+import sys
+sys.modules["orjson"] = None
+from vnengine.types import Script
+script = Script.from_json('{"events":[],"labels":{"start":%d}}' % 2**70)
+print(script.labels["start"] == 2**70)
+""".strip()
+        env = os.environ.copy()
+        pythonpath_parts = [str(Path(__file__).resolve().parents[2] / "python")]
+        if env.get("PYTHONPATH"):
+            pythonpath_parts.append(env["PYTHONPATH"])
+        env["PYTHONPATH"] = os.pathsep.join(pythonpath_parts)
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        self.assertEqual(result.stdout.strip(), "True")
+
+    def test_script_sorts_labels_once_and_owns_them(self):
+        source = {"b": 1, "a": 0}
+        script = Script(events=[], labels=source)
+        source["c"] = 2
+        self.assertEqual(list(script.labels), ["a", "b"])
+        exported = script.to_dict()["labels"]
+        exported["z"] = 9
+        self.assertEqual(list(script.labels), ["a", "b"])
+
+    def test_script_copies_labels_that_are_already_ordered(self):
+        source = {"a": 0, "b": 1}
+        script = Script(events=[], labels=source)
+        self.assertIsNot(script.labels, source)
+        self.assertEqual(script.labels, source)
+        with self.assertRaises(ValueError):
+            Script.from_dict({"events": [], "labels": {"start": "0"}})
+
+    def test_script_json_matches_encoding_the_full_dict(self):
+        builder = ScriptBuilder()
+        builder.label("start")
+        builder.dialogue("Ava", "¿Qué?")
+        builder.choice("Go?", [("Yes", "end"), ("No", "start")])
+        builder.scene("bg.png", None, [("Ava", "smile", "left")])
+        builder.audio_action("bgm", "play", asset="a.ogg", volume=0.5)
+        builder.label("end")
+        script = builder.build()
+        expected = json.dumps(script.to_dict(), separators=(",", ":"), sort_keys=True)
+        self.assertEqual(script.to_json(), expected)
+        self.assertEqual(script.to_json(), expected)
+
+    def test_dialogue_fragment_matches_generic_encoding(self):
+        event = Dialogue(speaker='A "q"', text="line\\\n\té\U0001f600")
+        self.assertEqual(
+            event._json_fragment(),
+            json.dumps(event.to_dict(), separators=(",", ":"), sort_keys=True),
+        )
+
+    def test_script_json_is_computed_once(self):
+        script = Script(events=[Dialogue(speaker="Ava", text="Hola")], labels={})
+        first = script.to_json()
+        self.assertIs(script.to_json(), first)
+        self.assertEqual(script, Script.from_json(first))
+        self.assertNotIn("_json_cache", repr(script))
+        self.assertNotIn("_json_cache", [item.name for item in fields(script)])
+
+    def test_script_from_json_interns_repeated_names(self):
+        parsed = Script.from_json(
+            '{"events":['
+            '{"type":"dialogue","speaker":"Narrator","text":"a"},'
+            '{"type":"dialogue","speaker":"Narrator","text":"b"},'
+            '{"type":"jump","target":"start"}],"labels":{"start":0}}'
+        )
+        self.assertIs(parsed.events[0].speaker, parsed.events[1].speaker)
+        self.assertIs(parsed.events[2].target, next(iter(parsed.labels)))
+
     def test_script_accepts_missing_schema_version_for_legacy(self):
         parsed = Script.from_json('{"events": [], "labels": {"start": 0}}')
         self.assertEqual(parsed.labels["start"], 0)
@@ -50,9 +155,15 @@ class TypesTests(unittest.TestCase):
         )
         self.assertEqual(parsed.labels["start"], 0)
 
+    def test_script_from_json_rejects_malformed_json_with_value_error(self):
+        with self.assertRaises(ValueError):
+            Script.from_json('{"events": [')
+
     def test_event_from_dict_rejects_unknown_type(self):
         with self.assertRaises(ValueError):
             event_from_dict({"type": "unknown"})
+        with self.assertRaises(ValueError):
+            event_from_dict({"type": ["dialogue"]})
 
     def test_character_from_dict_coerces_optional_fields(self):
         placement = CharacterPlacement.from_dict(
@@ -62,8 +173,12 @@ class TypesTests(unittest.TestCase):
         self.assertEqual(placement.position, "True")
 
     def test_set_flag_from_dict_requires_bool(self):
-        with self.assertRaises(ValueError):
+        with self.assertRaisesRegex(ValueError, "SetFlag 'value' must be bool"):
             SetFlag.from_dict({"key": "flag", "value": "false"})
+        with self.assertRaisesRegex(ValueError, "CondFlag 'is_set' must be bool"):
+            JumpIf.from_dict(
+                {"cond": {"kind": "flag", "key": "flag", "is_set": 1}, "target": "a"}
+            )
 
     def test_set_var_from_dict_requires_int(self):
         with self.assertRaises(ValueError):
@@ -75,6 +190,46 @@ class TypesTests(unittest.TestCase):
                 {"type": "jump_if", "cond": {"kind": "unknown"}, "target": "end"}
             )
 
+    def test_event_json_cache_stays_out_of_dicts_and_fields(self):
+        choice = Choice(prompt="Go?", options=[ChoiceOption(text="Yes", target="end")])
+        first = choice._json_fragment()
+        self.assertIs(choice._json_fragment(), first)
+        exported = choice.to_dict()
+        exported["options"].clear()
+        self.assertEqual(len(choice.to_dict()["options"]), 1)
+        self.assertEqual([item.name for item in fields(choice)], ["prompt", "options"])
+        self.assertEqual(
+            asdict(choice),
+            {"prompt": "Go?", "options": ({"text": "Yes", "target": "end"},)},
+        )
+        self.assertEqual(choice, Choice(prompt="Go?", options=list(choice.options)))
+        self.assertNotIn("_json_cache", repr(choice))
+
+    def test_sequence_fields_are_stored_as_tuples(self):
+        self.assertIs(Scene().characters, Scene(music="a.ogg").characters)
+        options = [ChoiceOption(text="Yes", target="end")]
+        choice = Choice(prompt="Go?", options=options)
+        self.assertEqual(choice.options, tuple(options))
+        self.assertEqual(choice, Choice(prompt="Go?", options=tuple(options)))
+        script = Script(events=[choice], labels={})
+        self.assertIsInstance(script.events, tuple)
+        self.assertEqual(Script.from_json(script.to_json()), script)
+
+    def test_script_iterates_events_by_type(self):
+        first = Dialogue(speaker="Ava", text="Hola")
+        choice = Choice(prompt="Go?", options=[ChoiceOption(text="Yes", target="a")])
+        second = Dialogue(speaker="Bo", text="Adios")
+        script = Script(events=[first, Scene(), choice, second], labels={"a": 0})
+        self.assertEqual(list(script.iter_dialogues()), [first, second])
+        self.assertEqual(list(script.iter_choices()), [choice])
+        self.assertEqual(list(Script().iter_choices()), [])
+        self.assertNotIn("_events_by_type", repr(script))
+
+    @unittest.skipIf(sys.version_info < (3, 10), "dataclass slots need Python 3.10+")
+    def test_events_do_not_carry_instance_dict(self):
+        self.assertFalse(hasattr(Dialogue(speaker="Ava", text="Hola"), "__dict__"))
+        self.assertFalse(hasattr(Script(), "__dict__"))
+
     def test_audio_transition_and_position_roundtrip(self):
         events = [
             AudioAction(channel="bgm", action="play", asset="music.ogg"),
@@ -146,6 +301,23 @@ class LocalizationTests(unittest.TestCase):
         keys = collect_script_localization_keys(script)
         self.assertEqual(keys, {"speaker.narrator", "dialogue.intro"})
 
+        choice_script = Script(
+            events=[
+                Choice(
+                    prompt=" loc:choice.prompt ",
+                    options=[
+                        ChoiceOption(text="loc:choice.yes", target="start"),
+                        ChoiceOption(text="loc: ", target="start"),
+                    ],
+                )
+            ],
+            labels={"start": 0},
+        )
+        self.assertEqual(
+            collect_script_localization_keys(choice_script),
+            {"choice.prompt", "choice.yes"},
+        )
+
         catalog = LocalizationCatalog(
             default_locale="en",
             locales={
@@ -158,6 +330,18 @@ class LocalizationTests(unittest.TestCase):
         self.assertIn("es:dialogue.intro", missing)
         self.assertIn("es:unused", orphan)
 
+    def test_catalog_resolve_falls_back_to_default_locale(self):
+        catalog = LocalizationCatalog(
+            default_locale="en",
+            locales={"en": {"greet": "Hello", "bye": "Bye"}, "es": {"greet": ""}},
+        )
+        self.assertEqual(catalog.resolve("es", "greet"), "")
+        self.assertEqual(catalog.resolve("es", "bye"), "Bye")
+        self.assertEqual(catalog.resolve("fr", "bye"), "Bye")
+        self.assertIsNone(catalog.resolve("es", "missing"))
+        self.assertEqual(catalog.resolve_or_key("es", "missing"), "missing")
+        self.assertIsNone(LocalizationCatalog().resolve("en", "greet"))
+
 
 class BuilderTests(unittest.TestCase):
     def test_builder_json_is_stable_across_threads(self):
@@ -202,6 +386,71 @@ class BuilderTests(unittest.TestCase):
         )
         self.assertTrue(any(event["type"] == "ext_call" for event in payload["events"]))
 
+    def test_builder_bulk_dialogues_match_single_appends(self):
+        bulk = ScriptBuilder()
+        bulk.label("start")
+        bulk.dialogues([("Ava", "Hola"), ("Bo", "Adios")])
+        single = ScriptBuilder()
+        single.label("start")
+        single.dialogue("Ava", "Hola")
+        single.dialogue("Bo", "Adios")
+        self.assertEqual(bulk.to_json(), single.to_json())
+
+    def test_builder_bulk_dialogues_leave_builder_unchanged_on_bad_line(self):
+        builder = ScriptBuilder()
+        builder.label("start")
+        builder.dialogue("Ava", "Hola")
+        before = builder.to_json()
+        with self.assertRaises(ValueError):
+            builder.dialogues([("Bo", "Adios"), ("Cy", "too", "many")])
+        self.assertEqual(len(builder.events), 1)
+        self.assertEqual(builder.to_json(), before)
+        self.assertEqual(builder.to_json(), builder.build().to_json())
+
+    def test_builder_json_cache_is_dropped_on_mutation(self):
+        builder = ScriptBuilder()
+        builder.label("start")
+        builder.dialogue("Ava", "Hola")
+        first = builder.to_json()
+        self.assertIs(builder.to_json(), first)
+
+        builder.dialogue("Ava", "Adios")
+        self.assertIn("Adios", builder.to_json())
+        builder.label("end")
+        self.assertIn('"end":2', builder.to_json())
+        self.assertEqual(builder.to_dict(), builder.build().to_dict())
+        self.assertEqual(builder.to_json(), builder.build().to_json())
+
+    def test_builder_serializes_labels_sorted_when_added_out_of_order(self):
+        builder = ScriptBuilder()
+        builder.label("zeta")
+        builder.dialogue("Ava", "Hola")
+        builder.label("alpha")
+        builder.dialogue("Ava", "Adios")
+        builder.label("zeta")
+        payload = json.loads(builder.to_json())
+        self.assertEqual(list(payload["labels"].items()), [("alpha", 1), ("zeta", 2)])
+        self.assertEqual(list(builder.build().labels), ["alpha", "zeta"])
+        self.assertEqual(list(builder.labels), ["zeta", "alpha"])
+
+    def test_builder_views_are_read_only_and_live(self):
+        builder = ScriptBuilder()
+        events = builder.events
+        labels = builder.labels
+        builder.label("start")
+        builder.dialogue("Ava", "Hola")
+
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0], Dialogue(speaker="Ava", text="Hola"))
+        self.assertEqual(dict(labels), {"start": 0})
+        with self.assertRaises(TypeError):
+            labels["end"] = 1
+        self.assertFalse(hasattr(events, "append"))
+        self.assertEqual(events, [Dialogue(speaker="Ava", text="Hola")])
+        self.assertEqual([Dialogue(speaker="Ava", text="Hola")], builder.events)
+        self.assertEqual(events, builder.events)
+        self.assertNotEqual(events, [])
+
     def test_builder_ext_call_rejects_non_string_args(self):
         builder = ScriptBuilder()
         with self.assertRaises(ValueError):
@@ -231,6 +480,20 @@ class EngineWrapperTests(unittest.TestCase):
         engine_cls = _load_native_engine()
         self.assertIs(engine_cls, FakeEngine)
 
+    def test_native_engine_lookup_is_cached_per_module(self):
+        module = types.ModuleType("visual_novel_engine")
+        module.PyEngine = type("FakeEngine", (), {})
+        sys.modules["visual_novel_engine"] = module
+        first = _load_native_engine()
+
+        module.PyEngine = type("OtherEngine", (), {})
+        self.assertIs(_load_native_engine(), first)
+
+        replacement = types.ModuleType("visual_novel_engine")
+        replacement.Engine = type("ReplacementEngine", (), {})
+        sys.modules["visual_novel_engine"] = replacement
+        self.assertIs(_load_native_engine(), replacement.Engine)
+
     def test_engine_from_script_accepts_mapping(self):
         captured = {}
         module = types.ModuleType("visual_novel_engine")
@@ -326,6 +589,163 @@ class EngineWrapperTests(unittest.TestCase):
             engine.last_audio_commands(), [{"type": "play_bgm", "path": "theme.ogg"}]
         )
 
+    def test_engine_drain_until_choice_falls_back_to_stepping(self):
+        module = types.ModuleType("visual_novel_engine")
+        events = [
+            {"type": "dialogue", "speaker": "Ava", "text": "Hola"},
+            {"type": "choice", "prompt": "Go?", "options": []},
+        ]
+
+        class FakeEngine:
+            def __init__(self, script_json):
+                self.index = 0
+
+            def current_event(self):
+                if self.index >= len(events):
+                    raise ValueError("script exhausted")
+                return events[self.index]
+
+            def step(self):
+                self.index += 1
+                return events[self.index - 1]
+
+        module.Engine = FakeEngine
+        sys.modules["visual_novel_engine"] = module
+
+        engine = Engine.from_script(
+            {
+                "script_schema_version": SCRIPT_SCHEMA_VERSION,
+                "events": [],
+                "labels": {"start": 0},
+            }
+        )
+        self.assertEqual(engine.drain_until_choice(), events[:1])
+        self.assertEqual(engine.current_event()["type"], "choice")
+
+    def test_engine_from_compiled_uses_native_blob_constructor(self):
+        module = types.ModuleType("visual_novel_engine")
+
+        class FakeEngine:
+            def __init__(self, script_json):
+                self.source = script_json
+
+            @staticmethod
+            def from_compiled_bytes(data):
+                engine = FakeEngine(None)
+                engine.source = data
+                return engine
+
+            def compiled_bytes(self):
+                return b"VNSC" + self.source.encode()
+
+        module.Engine = FakeEngine
+        sys.modules["visual_novel_engine"] = module
+
+        engine = Engine.from_script('{"events":[],"labels":{}}')
+        blob = engine.compiled_bytes()
+        restored = Engine.from_compiled(blob)
+        self.assertIsInstance(restored, Engine)
+        self.assertEqual(restored.raw.source, blob)
+        self.assertEqual(restored.last_audio_commands(), [])
+
+    def test_engine_current_event_type_prefers_native_tag(self):
+        module = types.ModuleType("visual_novel_engine")
+
+        class FakeEngine:
+            def __init__(self, script_json):
+                pass
+
+            def current_event_tag(self):
+                return 1
+
+            def supported_event_types(self):
+                return ["dialogue", "scene", "choice"]
+
+            def current_event(self):
+                raise AssertionError("tag lookup should not build the event dict")
+
+        module.Engine = FakeEngine
+        sys.modules["visual_novel_engine"] = module
+
+        engine = Engine.from_script('{"events":[],"labels":{}}')
+        self.assertEqual(engine.current_event_type(), "scene")
+
+    def test_engine_is_finished_falls_back_to_current_event(self):
+        module = types.ModuleType("visual_novel_engine")
+
+        class FakeEngine:
+            def __init__(self, script_json):
+                pass
+
+            def current_event(self):
+                raise ValueError("script exhausted")
+
+        module.Engine = FakeEngine
+        sys.modules["visual_novel_engine"] = module
+
+        engine = Engine.from_script('{"events":[],"labels":{}}')
+        self.assertTrue(engine.is_finished())
+
+    def test_engine_reset_forwards_label_and_clears_audio(self):
+        module = types.ModuleType("visual_novel_engine")
+
+        class FakeEngine:
+            def __init__(self, script_json):
+                self.resets = []
+
+            def reset(self, to_label):
+                self.resets.append(to_label)
+
+        module.Engine = FakeEngine
+        sys.modules["visual_novel_engine"] = module
+
+        engine = Engine.from_script('{"events":[],"labels":{}}')
+        engine._last_audio = [{"type": "stop_bgm"}]
+        engine.reset("end")
+        self.assertEqual(engine.raw.resets, ["end"])
+        self.assertEqual(engine.last_audio_commands(), [])
+
+    def test_engine_from_script_hands_dicts_to_native_from_dict(self):
+        module = types.ModuleType("visual_novel_engine")
+
+        class FakeEngine:
+            def __init__(self, script_json):
+                raise AssertionError("dicts should not be serialized in Python")
+
+            @staticmethod
+            def from_dict(script):
+                engine = FakeEngine.__new__(FakeEngine)
+                engine.script = script
+                return engine
+
+        module.Engine = FakeEngine
+        sys.modules["visual_novel_engine"] = module
+
+        payload = {"events": [], "labels": {}}
+        engine = Engine.from_script(payload)
+        self.assertIs(engine.raw.script, payload)
+
+    def test_engine_resolves_native_methods_once(self):
+        module = types.ModuleType("visual_novel_engine")
+
+        class FakeEngine:
+            def __init__(self, script_json):
+                pass
+
+            def visual_state(self):
+                return {"background": "room"}
+
+        module.Engine = FakeEngine
+        sys.modules["visual_novel_engine"] = module
+
+        engine = Engine.from_script('{"events":[],"labels":{}}')
+        self.assertNotIn("visual_state", vars(engine))
+        self.assertIs(engine._native_visual_state.__self__, engine.raw)
+        self.assertEqual(engine.visual_state(), {"background": "room"})
+        self.assertEqual(engine.prefetch_assets_hint(), [])
+        with self.assertRaisesRegex(RuntimeError, "ui_state access"):
+            engine.ui_state()
+
     def test_engine_ui_state_calls_native(self):
         module = types.ModuleType("visual_novel_engine")
 
@@ -485,6 +905,11 @@ print(engine.raw.script_json)
 
 
 class EngineAppTests(unittest.TestCase):
+    @staticmethod
+    def _app(native_engine):
+        # EngineApp drives the Engine wrapper, whose fallbacks cover fake natives.
+        return EngineApp(Engine._from_native(native_engine))
+
     def test_engine_app_runs_choices(self):
         events = [
             {"type": "choice", "prompt": "Go?", "options": []},
@@ -514,6 +939,123 @@ class EngineAppTests(unittest.TestCase):
         self.assertEqual(collected[0]["type"], "choice")
         self.assertEqual(collected[1]["type"], "dialogue")
 
+    def test_engine_app_uses_batch_drain_when_available(self):
+        events = [
+            {"type": "dialogue", "speaker": "Ava", "text": "Hola"},
+            {"type": "choice", "prompt": "Go?", "options": []},
+            {"type": "dialogue", "speaker": "Ava", "text": "Done"},
+        ]
+
+        class BatchEngine:
+            def __init__(self):
+                self.index = 0
+                self.drains = 0
+
+            def drain_until_choice(self):
+                self.drains += 1
+                drained = []
+                while (
+                    self.index < len(events) and events[self.index]["type"] != "choice"
+                ):
+                    drained.append(events[self.index])
+                    self.index += 1
+                return drained
+
+            def current_event(self):
+                if self.index >= len(events):
+                    raise ValueError("script exhausted")
+                return events[self.index]
+
+            def choose(self, option_index):
+                self.index += 1
+                return events[self.index - 1]
+
+            def step(self):
+                raise AssertionError("step() should not be needed with batch drain")
+
+        engine = BatchEngine()
+        collected = self._app(engine).run()
+        self.assertEqual(collected, events)
+        self.assertEqual(engine.drains, 2)
+
+    def test_engine_app_run_scripted_replays_choice_indices(self):
+        picked = []
+
+        class ChoiceEngine:
+            def __init__(self):
+                self.remaining = 3
+
+            def current_event(self):
+                if not self.remaining:
+                    raise ValueError("script exhausted")
+                return {"type": "choice", "prompt": "Go?", "options": []}
+
+            def choose(self, option_index):
+                picked.append(option_index)
+                self.remaining -= 1
+
+        collected = self._app(ChoiceEngine()).run_scripted([2, 1])
+        self.assertEqual(len(collected), 3)
+        self.assertEqual(picked, [2, 1, 0])
+
+    def test_engine_app_only_builds_choice_events_up_front(self):
+        events = [
+            {"type": "dialogue", "speaker": "Ava", "text": "Hola"},
+            {"type": "choice", "prompt": "Go?", "options": []},
+        ]
+
+        class TaggedEngine:
+            def __init__(self):
+                self.index = 0
+                self.built = []
+
+            def is_finished(self):
+                return self.index >= len(events)
+
+            def current_event_tag(self):
+                if self.index >= len(events):
+                    raise ValueError("script exhausted")
+                return 0 if events[self.index]["type"] == "dialogue" else 1
+
+            def supported_event_types(self):
+                return ["dialogue", "choice"]
+
+            def current_event(self):
+                self.built.append(self.index)
+                return events[self.index]
+
+            def choose(self, option_index):
+                self.index += 1
+
+            def step(self):
+                self.index += 1
+                return events[self.index - 1]
+
+        engine = TaggedEngine()
+        self.assertEqual(self._app(engine).run(), events)
+        self.assertEqual(engine.built, [1])
+
+    def test_engine_app_stops_on_is_finished_without_exceptions(self):
+        events = [{"type": "dialogue", "speaker": "Ava", "text": "Hola"}]
+
+        class FinishingEngine:
+            def __init__(self):
+                self.index = 0
+
+            def is_finished(self):
+                return self.index >= len(events)
+
+            def current_event(self):
+                if self.index >= len(events):
+                    raise AssertionError("run() should check is_finished first")
+                return events[self.index]
+
+            def step(self):
+                self.index += 1
+                return events[self.index - 1]
+
+        self.assertEqual(self._app(FinishingEngine()).run(), events)
+
     def test_engine_app_propagates_unexpected_errors(self):
         class BrokenEngine:
             def current_event(self):
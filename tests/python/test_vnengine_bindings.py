@@ -181,6 +181,19 @@ class NativeBindingsTests(unittest.TestCase):
         self.assertEqual(history[0]["option_index"], 0)
         self.assertEqual(history[0]["option_text"], "Volver")
 
+    def test_engine_reset_restarts_without_reparsing(self):
+        if not hasattr(self.native.Engine, "reset"):
+            self.skipTest("Engine binding without reset API")
+        engine = self.native.Engine(self._dialogue_script_json())
+        engine.step()
+        engine.step()
+        self.assertTrue(engine.is_finished())
+
+        engine.reset()
+        self.assertEqual(engine.current_event()["text"], "Hola")
+        with self.assertRaises(ValueError):
+            engine.reset(to_label="missing")
+
 
 class GuiBindingTests(unittest.TestCase):
     def test_run_visual_novel_rejects_invalid_json(self):
@@ -217,6 +230,36 @@ class GuiBindingTests(unittest.TestCase):
         bookmarks = dict(graph.list_bookmarks())
         self.assertEqual(bookmarks["intro"], dialogue)
 
+    def test_node_graph_bulk_add_and_connect(self):
+        import visual_novel_engine as vn
+
+        if not hasattr(vn, "NodeGraph") or not hasattr(vn.NodeGraph, "add_nodes"):
+            self.skipTest("Native GUI build without bulk graph APIs")
+
+        graph = vn.NodeGraph()
+        start, dialogue, end = graph.add_nodes(
+            [
+                (vn.StoryNode.start(), 0.0, 0.0),
+                (vn.StoryNode.dialogue("Ava", "Hola"), 0.0, 100.0),
+                (vn.StoryNode.end(), 0.0, 200.0),
+            ]
+        )
+        graph.connect_many([(start, dialogue), (dialogue, end)])
+        self.assertEqual(graph.node_count(), 3)
+        self.assertEqual(graph.connection_count(), 2)
+
+    def test_lint_severity_is_hashable_by_value(self):
+        import visual_novel_engine as vn
+
+        if not hasattr(vn, "LintSeverity"):
+            self.skipTest("GUI lint bindings are not available in this native build")
+
+        icons = {vn.LintSeverity.Error: "error", vn.LintSeverity.Info: "info"}
+        graph = vn.NodeGraph()
+        graph.add_node(vn.StoryNode.dialogue("Someone", "Hello!"), 0.0, 0.0)
+        labels = [icons.get(issue.severity) for issue in vn.py_validate_graph(graph)]
+        self.assertIn("error", labels)
+
     def test_node_graph_autofix_bindings(self):
         import visual_novel_engine as vn
 